@@ -15,7 +15,7 @@ from .models import (
     Suggestion,
     SuggestionSource,
 )
-from .rules import analyze_requirement, analyze_requirements, compute_score
+from .rules import analyze_requirement, analyze_requirements, compute_score, iter_analyze_requirements
 
 __all__ = [
     "AnalysisResult",
@@ -27,4 +27,5 @@ __all__ = [
     "analyze_requirement",
     "analyze_requirements",
     "compute_score",
+    "iter_analyze_requirements",
 ]
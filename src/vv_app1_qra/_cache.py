@@ -0,0 +1,164 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+============================================================
+vv_app1_qra._cache
+------------------------------------------------------------
+Description :
+    Cache disque (sqlite3) des suggestions IA, par exigence (APP1 — QRA).
+
+Rôle :
+    - Éviter de re-payer un appel IA pour une exigence inchangée entre deux runs
+      (même si les tranches du batch sont composées différemment)
+    - Clé = make_key(model, payload) ; payload construit par ia_assistant._item_cache_key :
+      consignes/gabarits/schéma + max_suggestions + empreinte du contenu de l'exigence (hors req_id)
+    - Valeur = liste JSON des suggestions de cette exigence (entrée "suggestions" de la réponse)
+    - Lecture/écriture groupées (get_many / set_many) : une connexion par lot
+
+Variables d'environnement :
+    - QRA_AI_CACHE_PATH : fichier sqlite (default: ~/.cache/vv_app1_qra/ai.sqlite)
+    - QRA_AI_CACHE_TTL  : durée de vie en secondes (default: 604800 = 7 j, 0 = cache désactivé)
+
+Contraintes :
+    - stdlib only
+    - Non bloquant : toute erreur cache est ignorée (miss / écriture perdue)
+    - Thread-safe : une connexion sqlite par opération
+============================================================
+"""
+
+from __future__ import annotations
+
+# ============================================================
+# 📦 Imports
+# ============================================================
+import hashlib
+import logging
+import os
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+# ============================================================
+# 🔎 Public exports
+# ============================================================
+__all__ = [
+    "make_key",
+    "get_many",
+    "set_many",
+    "cache_ttl",
+]
+
+log = logging.getLogger(__name__)
+
+_DEFAULT_TTL_S = 7 * 24 * 3600
+
+# Borne du nombre de paramètres par requête (SQLITE_MAX_VARIABLE_NUMBER historique = 999)
+_MAX_SQL_VARS = 500
+
+# Fichiers dont le dossier + la table ont déjà été créés dans ce process (mkdir/DDL une seule fois)
+_ready: "set[Path]" = set()
+_ready_lock = threading.Lock()
+
+
+# ============================================================
+# 🔧 Helpers
+# ============================================================
+def _cache_path() -> Path:
+    raw = (os.getenv("QRA_AI_CACHE_PATH") or "").strip()
+    if raw:
+        return Path(raw)
+    return Path.home() / ".cache" / "vv_app1_qra" / "ai.sqlite"
+
+
+def cache_ttl() -> int:
+    """TTL en secondes (QRA_AI_CACHE_TTL). 0 => cache désactivé."""
+    try:
+        return max(0, int((os.getenv("QRA_AI_CACHE_TTL") or str(_DEFAULT_TTL_S)).strip()))
+    except ValueError:
+        return _DEFAULT_TTL_S
+
+
+def _connect() -> sqlite3.Connection:
+    path = _cache_path()
+    if path in _ready:
+        return sqlite3.connect(str(path), timeout=5.0)
+
+    path.parent.mkdir(parents=True, exist_ok=True)
+    conn = sqlite3.connect(str(path), timeout=5.0)
+    try:
+        conn.execute("CREATE TABLE IF NOT EXISTS cache(k TEXT PRIMARY KEY, v BLOB, exp INTEGER)")
+    except Exception:
+        conn.close()
+        raise
+    with _ready_lock:
+        _ready.add(path)
+    return conn
+
+
+def _forget() -> None:
+    """Après une erreur sqlite, ré-initialiser au prochain accès (fichier supprimé entre-temps, etc.)."""
+    with _ready_lock:
+        _ready.clear()
+
+
+def _decode(v: object) -> str:
+    return v.decode("utf-8") if isinstance(v, (bytes, bytearray)) else str(v)
+
+
+def make_key(model: str, payload: str) -> str:
+    """
+    Clé de cache stable : sha256(model + NUL + payload).
+    `payload` = tout ce qui détermine la valeur (cf. ia_assistant._item_cache_key, clé par exigence).
+    """
+    return hashlib.sha256(f"{model}\0{payload}".encode("utf-8")).hexdigest()
+
+
+# ============================================================
+# 🔧 API
+# ============================================================
+def get_many(keys: Sequence[str]) -> Dict[str, str]:
+    """Lecture groupée : {clé: valeur} pour les entrées présentes et non expirées."""
+    if not keys or cache_ttl() <= 0:
+        return {}
+    uniq = list(dict.fromkeys(keys))
+    now = int(time.time())
+    out: Dict[str, str] = {}
+    try:
+        conn = _connect()
+        try:
+            for i in range(0, len(uniq), _MAX_SQL_VARS):
+                part = uniq[i : i + _MAX_SQL_VARS]
+                marks = ",".join("?" * len(part))
+                for k, v, exp in conn.execute(f"SELECT k, v, exp FROM cache WHERE k IN ({marks})", part):
+                    if int(exp) >= now:
+                        out[k] = _decode(v)
+        finally:
+            conn.close()
+    except Exception as e:
+        _forget()
+        log.debug(f"AI cache read failed -> miss ({e})")
+        return {}
+    return out
+
+
+def set_many(entries: Iterable[Tuple[str, str]], ttl: Optional[int] = None) -> None:
+    """Écriture groupée (une transaction) ; ttl par défaut = cache_ttl()."""
+    ttl_s = cache_ttl() if ttl is None else int(ttl)
+    if ttl_s <= 0:
+        return
+    exp = int(time.time()) + ttl_s
+    rows: List[Tuple[str, bytes, int]] = [(k, v.encode("utf-8"), exp) for k, v in entries]
+    if not rows:
+        return
+    try:
+        conn = _connect()
+        try:
+            with conn:
+                conn.executemany("INSERT OR REPLACE INTO cache(k, v, exp) VALUES (?, ?, ?)", rows)
+        finally:
+            conn.close()
+    except Exception as e:
+        _forget()
+        log.debug(f"AI cache write failed -> ignored ({e})")
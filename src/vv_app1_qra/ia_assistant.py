@@ -17,12 +17,19 @@ Variables d'environnement :
     - ENABLE_AI         : 0/1 (default: 0)
     - OPENAI_API_KEY    : clé API (si absent -> IA désactivée)
     - OPENAI_MODEL      : modèle (default: gpt-5) [ajustable]
+    - QRA_AI_WORKERS    : appels IA concurrents max (default: 8)
+    - QRA_AI_CACHE_TTL  : TTL cache disque des réponses IA en s (0 = désactivé)
+    - QRA_AI_CACHE_PATH : fichier sqlite du cache (default: ~/.cache/vv_app1_qra/ai.sqlite)
+                          (une entrée par exigence : clé = modèle + gabarits + contenu + issues)
 
 Usage :
-    - Appel depuis vv_app1_qra.main via suggest_improvements()
+    - Appel depuis vv_app1_qra.main via suggest_improvements_batch()
+      (plusieurs exigences par appel API, réponse indexée par position dans la tranche)
+    - iter_suggestions_batch() : variante streaming (résultats par tranche terminée)
+    - suggest_improvements() : wrapper mono-exigence
 
 Notes :
-    - Sortie attendue strictement JSON (contrat interne).
+    - Sortie contrainte par JSON schema (structured outputs, strict).
     - Si JSON invalide / SDK absent / appel échoue => fallback [].
 ============================================================
 """
@@ -32,13 +39,131 @@ from __future__ import annotations
 # ============================================================
 # 📦 Imports
 # ============================================================
+import hashlib
 import json
 import logging
 import os
-from typing import List, Optional, Sequence
-
+import random
+import threading
+import time
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from functools import lru_cache
+from typing import Any, Dict, Iterator, List, Optional, Sequence, Tuple
+
+try:  # accélération JSON optionnelle (pip install -e ".[fast]")
+    import orjson  # type: ignore
+except ImportError:  # pragma: no cover - dépend de l'environnement
+    orjson = None  # type: ignore[assignment]
+
+from vv_app1_qra import _cache
 from vv_app1_qra.models import Issue, Requirement, Suggestion, SuggestionSource
 
+# (Requirement, issues détectées) : unité de travail pour le batch IA
+SuggestionItem = Tuple[Requirement, Sequence[Issue]]
+
+# Consignes fixes (identiques à chaque appel) envoyées en `instructions`, séparées de la partie
+# variable (`input`). Simple restructuration du prompt : ~150 tokens, bien sous le seuil de 1024 tokens
+# du prompt caching OpenAI => aucun effet de cache côté fournisseur. Aucune interpolation ici.
+_STATIC_INSTRUCTIONS = """
+You are a senior V&V / Requirements Engineering assistant.
+
+TASK:
+Given a list of requirements and their detected quality issues, propose for EACH requirement
+up to MAX_SUGGESTIONS_PER_REQUIREMENT improved requirement formulations and/or acceptance
+criteria suggestions.
+
+RULES:
+- Suggestions must be measurable and testable.
+- Avoid vague terms (e.g. fast, robust, if needed, as appropriate).
+- Keep each suggestion short and actionable.
+- Return exactly one entry per input requirement, echoing its item number and req_id
+  (req_id values may repeat; item numbers are unique).
+- confidence is your own estimate in [0.0, 1.0].
+""".strip()
+
+# Partie variable (input) : gabarits fixes, seuls les champs sont formatés à chaque appel
+_PROMPT_INPUT_TMPL = "MAX_SUGGESTIONS_PER_REQUIREMENT: {max_suggestions}\n\nINPUT REQUIREMENTS:\n{requirements_block}"
+
+_REQUIREMENT_BLOCK_TMPL = (
+    "item: {item}\n"
+    "req_id: {req_id}\n"
+    "title: {title}\n"
+    "text: {text}\n"
+    "verification_method: {verification_method}\n"
+    "acceptance_criteria: {acceptance_criteria}\n"
+    "detected_issues:\n"
+    "{issues_lines}"
+)
+
+_REQUIREMENT_SEPARATOR = "\n\n---\n\n"
+
+# Structured outputs (Responses API) : le modèle est contraint à ce schéma JSON
+_RESPONSE_SCHEMA: Dict[str, Any] = {
+    "type": "object",
+    "additionalProperties": False,
+    "required": ["results"],
+    "properties": {
+        "results": {
+            "type": "array",
+            "items": {
+                "type": "object",
+                "additionalProperties": False,
+                "required": ["item", "req_id", "suggestions"],
+                "properties": {
+                    "item": {"type": "integer"},
+                    "req_id": {"type": "string"},
+                    "suggestions": {
+                        "type": "array",
+                        "items": {
+                            "type": "object",
+                            "additionalProperties": False,
+                            "required": ["message", "rationale", "confidence"],
+                            "properties": {
+                                "message": {"type": "string"},
+                                "rationale": {"type": "string"},
+                                "confidence": {"type": "number"},
+                            },
+                        },
+                    },
+                },
+            },
+        },
+    },
+}
+
+_RESPONSE_FORMAT: Dict[str, Any] = {
+    "format": {
+        "type": "json_schema",
+        "name": "qra_out",
+        "schema": _RESPONSE_SCHEMA,
+        "strict": True,
+    }
+}
+
+# Partie fixe de la clé du cache disque : toute évolution des consignes/gabarits/du schéma invalide le cache
+_CACHE_KEY_PREFIX = "\0".join(
+    (
+        _STATIC_INSTRUCTIONS,
+        _PROMPT_INPUT_TMPL,
+        _REQUIREMENT_BLOCK_TMPL,
+        json.dumps(_RESPONSE_SCHEMA, sort_keys=True),
+    )
+)
+
+# Budget de sortie par suggestion demandée (borne le coût d'un appel)
+_OUTPUT_TOKENS_PER_SUGGESTION = 180
+# Marge fixe ajoutée au budget : sur les modèles de raisonnement, les tokens de raisonnement
+# sont décomptés du même max_output_tokens que le JSON visible
+_OUTPUT_TOKENS_REASONING_RESERVE = 4096
+
+# Client OpenAI partagé (voir _get_client)
+_client: Any = None
+_client_lock = threading.Lock()
+
+# Délai de base avant l'unique retry sur rate limit (secondes, + jitter)
+_RATE_LIMIT_BACKOFF_S = 1.0
+
 # ============================================================
 # 🧾 Logging (local, autonome)
 # ============================================================
@@ -76,9 +201,13 @@ def _truthy(value: str | None) -> bool:
     return v in {"1", "true", "yes", "y", "on"}
 
 
+@lru_cache(maxsize=1)
 def is_ai_enabled() -> bool:
     """
     IA activée seulement si ENABLE_AI est truthy ET OPENAI_API_KEY présent.
+
+    Lu une fois par process (env figé pendant un run) ; `is_ai_enabled.cache_clear()`
+    pour relire l'environnement (tests).
     """
     if not _truthy(os.getenv("ENABLE_AI", "0")):
         return False
@@ -87,82 +216,315 @@ def is_ai_enabled() -> bool:
     return True
 
 
+@lru_cache(maxsize=1)
 def _get_model() -> str:
     """
-    Modèle par défaut. Ajustable via OPENAI_MODEL.
+    Modèle par défaut. Ajustable via OPENAI_MODEL (lu une fois par process).
     """
     return (os.getenv("OPENAI_MODEL") or "gpt-5").strip()
 
 
-def _build_prompt(req: Requirement, issues: Sequence[Issue], max_suggestions: int) -> str:
+def _get_client() -> Any:
     """
-    Prompt orienté V&V : suggestions concrètes, testables, mesurables.
-    Réponse attendue STRICTEMENT en JSON.
+    Client OpenAI partagé (import + construction paresseux, une fois par process).
+    Un seul pool de connexions HTTP (keep-alive) pour tous les appels, y compris threads.
+
+    Raises:
+        ImportError: SDK openai absent
+        Exception: échec de construction du client (non mis en cache)
     """
-    issues_lines = "\n".join(
-        f"- {i.rule_id} [{i.severity.value}] {i.category}: {i.message}"
-        for i in issues
-    ) or "- (none)"
+    global _client
+    if _client is None:
+        with _client_lock:
+            if _client is None:
+                from openai import OpenAI  # type: ignore
 
-    return f"""
-You are a senior V&V / Requirements Engineering assistant.
+                _client = OpenAI()
+    return _client
 
-TASK:
-Given a requirement and detected quality issues, propose up to {max_suggestions} improved requirement formulations
-and/or acceptance criteria suggestions.
 
-RULES:
-- Suggestions must be measurable and testable.
-- Avoid vague terms (e.g. fast, robust, if needed, as appropriate).
-- Keep each suggestion short and actionable.
-- Output MUST be valid JSON ONLY (no markdown, no prose).
-
-INPUT REQUIREMENT (fields):
-req_id: {req.req_id}
-title: {req.title}
-text: {req.text}
-verification_method: {req.verification_method}
-acceptance_criteria: {req.acceptance_criteria}
-
-DETECTED ISSUES:
-{issues_lines}
-
-OUTPUT JSON SCHEMA:
-{{
-  "suggestions": [
-    {{
-      "message": "string",
-      "rationale": "string",
-      "confidence": 0.0
-    }}
-  ]
-}}
-""".strip()
+def _reset_client() -> None:
+    """Oublie le client partagé (tests / changement de configuration)."""
+    global _client
+    with _client_lock:
+        _client = None
+
+
+def _max_workers() -> int:
+    """
+    Nombre max d'appels IA concurrents. Ajustable via QRA_AI_WORKERS (default: 8).
+    """
+    try:
+        return max(1, int((os.getenv("QRA_AI_WORKERS") or "8").strip()))
+    except ValueError:
+        return 8
+
+
+def _item_key(req: Requirement, issues: Sequence[Issue]) -> str:
+    """
+    Empreinte du contenu envoyé à l'IA pour une exigence (hors req_id) :
+    deux exigences de même contenu + mêmes issues => même suggestion attendue.
+    """
+    parts = [req.title, req.text, req.verification_method, req.acceptance_criteria]
+    parts.extend(f"{i.rule_id}|{i.severity.value}|{i.category}|{i.message}" for i in issues)
+    return hashlib.blake2b("\0".join(parts).encode("utf-8"), digest_size=16).hexdigest()
+
+
+def _item_cache_key(model: str, item_key: str, max_suggestions: int) -> str:
+    """Clé du cache disque pour une exigence (indépendante du req_id et de la tranche)."""
+    return _cache.make_key(model, f"{_CACHE_KEY_PREFIX}\0{max_suggestions}\0{item_key}")
+
+
+def _chunked(items: Sequence[Any], size: int) -> Iterator[Sequence[Any]]:
+    """Découpe une séquence en tranches de taille `size` (dernière tranche éventuellement plus courte)."""
+    step = max(1, int(size))
+    for i in range(0, len(items), step):
+        yield items[i : i + step]
+
+
+def _build_prompt(items: Sequence[SuggestionItem], max_suggestions: int) -> str:
+    """
+    Partie variable du prompt (batch) : limite de suggestions + exigences/issues.
+    Les consignes fixes sont dans _STATIC_INSTRUCTIONS (envoyées en `instructions`) ;
+    seuls les champs variables sont formatés (gabarits précompilés au chargement du module).
+    `item` = position 1..n dans la tranche : clé de ré-association des réponses (req_id peut se répéter).
+    """
+    blocks = [
+        _REQUIREMENT_BLOCK_TMPL.format(
+            item=pos,
+            req_id=req.req_id,
+            title=req.title,
+            text=req.text,
+            verification_method=req.verification_method,
+            acceptance_criteria=req.acceptance_criteria,
+            issues_lines="\n".join(
+                f"- {i.rule_id} [{i.severity.value}] {i.category}: {i.message}" for i in issues
+            ) or "- (none)",
+        )
+        for pos, (req, issues) in enumerate(items, 1)
+    ]
+    return _PROMPT_INPUT_TMPL.format(
+        max_suggestions=max_suggestions,
+        requirements_block=_REQUIREMENT_SEPARATOR.join(blocks),
+    )
 
 
 def _safe_parse_json(text: str) -> dict:
     """
     Parse JSON robuste : lève ModuleError si invalide.
+    Défense en profondeur (structured outputs garantit normalement un JSON valide).
     """
     try:
+        if orjson is not None:
+            return orjson.loads(text)
         return json.loads(text)
     except Exception as e:
         raise ModuleError(f"Invalid JSON from AI: {e}") from e
 
 
+def _to_suggestions(raw: Any, max_suggestions: int) -> List[Suggestion]:
+    """
+    Convertit la liste JSON brute d'une exigence en Suggestion (source=AI).
+    Les entrées invalides sont ignorées (tolérant).
+    """
+    if not isinstance(raw, list):
+        return []
+
+    out: List[Suggestion] = []
+    for item in raw[:max_suggestions]:
+        if not isinstance(item, dict):
+            continue
+        msg = (item.get("message") or "").strip()
+        if not msg:
+            continue
+        rationale = (item.get("rationale") or "").strip()
+        conf = item.get("confidence", None)
+
+        out.append(
+            Suggestion(
+                source=SuggestionSource.AI,
+                message=msg,
+                rule_id="AI-001",
+                rationale=rationale,
+                confidence=conf if isinstance(conf, (int, float)) else None,
+            )
+        )
+    return out
+
+
+def _responses_create(client: Any, model: str, prompt: str, *, max_output_tokens: Optional[int] = None) -> str:
+    """
+    Appel unique à l'API Responses ; retourne le texte brut de sortie.
+    Consignes fixes en `instructions` (partie fixe, sous le seuil du prompt caching), partie variable en `input`,
+    sortie contrainte par _RESPONSE_SCHEMA (structured outputs).
+    """
+    kwargs: Dict[str, Any] = {}
+    if max_output_tokens:
+        kwargs["max_output_tokens"] = int(max_output_tokens)
+    resp = client.responses.create(
+        model=model,
+        instructions=_STATIC_INSTRUCTIONS,
+        input=prompt,
+        text=_RESPONSE_FORMAT,
+        **kwargs,
+    )
+    if getattr(resp, "status", None) == "incomplete":
+        reason = getattr(getattr(resp, "incomplete_details", None), "reason", None)
+        raise ModuleError(f"AI output incomplete ({reason or 'unknown reason'})")
+    output_text = (getattr(resp, "output_text", None) or "").strip()
+    if not output_text:
+        output_text = str(resp).strip()
+    return output_text
+
+
+def _is_rate_limit_error(exc: BaseException) -> bool:
+    """Détecte openai.RateLimitError sans importer le SDK (dépendance optionnelle)."""
+    return type(exc).__name__ == "RateLimitError"
+
+
+def _call_with_retry(client: Any, model: str, prompt: str, *, max_output_tokens: Optional[int] = None) -> str:
+    """
+    Appel API avec un seul retry (sleep jitter) sur rate limit (HTTP 429).
+    """
+    try:
+        return _responses_create(client, model, prompt, max_output_tokens=max_output_tokens)
+    except Exception as e:
+        if not _is_rate_limit_error(e):
+            raise
+        delay = _RATE_LIMIT_BACKOFF_S * (1.0 + random.random())
+        log.debug(f"AI rate limited -> retry once in {delay:.1f}s")
+        time.sleep(delay)
+        return _responses_create(client, model, prompt, max_output_tokens=max_output_tokens)
+
+
+def _run_chunk(
+    client: Any,
+    model: str,
+    chunk: Sequence[Tuple[int, SuggestionItem]],
+    max_suggestions: int,
+    cache_keys: Optional[Dict[int, str]] = None,
+) -> List[Tuple[int, List[Suggestion]]]:
+    """
+    Traite une tranche (un prompt, un appel API) et retourne [(index, suggestions)].
+    Si `cache_keys` (index -> clé) est fourni, chaque exigence présente dans la réponse
+    est écrite dans le cache disque.
+    Sortie tronquée / JSON invalide (ex: budget de tokens épuisé) sur plusieurs exigences :
+    la tranche est rejouée en deux moitiés. Tranche unitaire en échec => [] (fallback, non bloquant).
+    """
+    prompt = _build_prompt([item for _, item in chunk], max_suggestions=max_suggestions)
+
+    try:
+        output_text = _call_with_retry(
+            client,
+            model,
+            prompt,
+            max_output_tokens=max_suggestions * _OUTPUT_TOKENS_PER_SUGGESTION * len(chunk)
+            + _OUTPUT_TOKENS_REASONING_RESERVE,
+        )
+        data = _safe_parse_json(output_text)
+    except ModuleError as e:
+        if len(chunk) > 1:
+            half = len(chunk) // 2
+            log.warning("AI output unusable for %d requirements -> retry as 2 smaller chunks (%s)", len(chunk), e)
+            return _run_chunk(client, model, chunk[:half], max_suggestions, cache_keys) + _run_chunk(
+                client, model, chunk[half:], max_suggestions, cache_keys
+            )
+        log.warning(f"AI returned invalid JSON -> fallback [] ({e})")
+        return []
+    except Exception as e:
+        log.warning(f"AI call failed -> fallback [] ({e})")
+        return []
+
+    raw_results = data.get("results", []) if isinstance(data, dict) else []
+    if not isinstance(raw_results, list):
+        log.warning("AI JSON invalid: 'results' is not a list -> fallback []")
+        return []
+
+    # Ré-association par position (`item`), acceptée seulement si le req_id renvoyé (s'il est présent)
+    # est celui de l'exigence à cette position : un `item` décalé (0-based, off-by-one) est rejeté.
+    # Repli sur req_id seulement s'il est unique dans la tranche (deux exigences de même req_id
+    # mais de contenus différents ne partagent jamais une réponse). Entrée rejetée => ni sortie ni cache.
+    by_item: Dict[int, Any] = {}
+    by_req_id: Dict[str, Any] = {}
+    for entry in raw_results:
+        if not isinstance(entry, dict):
+            continue
+        pos = entry.get("item")
+        rid = str(entry.get("req_id") or "").strip()
+        if type(pos) is int and 1 <= pos <= len(chunk) and (not rid or rid == chunk[pos - 1][1][0].req_id):
+            by_item.setdefault(pos, entry.get("suggestions", []))
+            continue
+        if pos is not None:
+            log.debug("AI entry item=%r req_id=%r does not match the chunk -> req_id fallback", pos, rid)
+        if rid and rid not in by_req_id:
+            by_req_id[rid] = entry.get("suggestions", [])
+
+    id_counts = Counter(req.req_id for _, (req, _issues) in chunk)
+
+    out: List[Tuple[int, List[Suggestion]]] = []
+    to_cache: List[Tuple[str, str]] = []
+    for pos, (idx, (req, _issues)) in enumerate(chunk, 1):
+        raw = by_item.get(pos)
+        if raw is None and id_counts[req.req_id] == 1:
+            raw = by_req_id.get(req.req_id)
+        try:
+            out.append((idx, _to_suggestions(raw, max_suggestions)))
+        except Exception as e:
+            log.warning("AI suggestions dropped for %s (%s)", req.req_id, e)
+            continue
+        if cache_keys and isinstance(raw, list):
+            to_cache.append((cache_keys[idx], json.dumps(raw, ensure_ascii=False)))
+
+    if to_cache:
+        _cache.set_many(to_cache)
+    return out
+
+
+def _cached_results(
+    unique: Sequence[Tuple[int, SuggestionItem]],
+    cache_keys: Dict[int, str],
+    max_suggestions: int,
+) -> Tuple[List[Tuple[int, List[Suggestion]]], List[Tuple[int, SuggestionItem]]]:
+    """
+    Sépare les exigences déjà en cache disque (suggestions relues) de celles à envoyer.
+    Entrée de cache illisible => traitée comme un miss.
+    """
+    found = _cache.get_many([cache_keys[idx] for idx, _ in unique])
+
+    hits: List[Tuple[int, List[Suggestion]]] = []
+    pending: List[Tuple[int, SuggestionItem]] = []
+    for idx, item in unique:
+        cached = found.get(cache_keys[idx])
+        if cached is not None:
+            try:
+                hits.append((idx, _to_suggestions(_safe_parse_json(cached), max_suggestions)))
+                continue
+            except Exception as e:
+                log.debug("AI cache entry unreadable -> miss (%s)", e)
+        pending.append((idx, item))
+    return hits, pending
+
+
 # ============================================================
 # 🤖 API principale
 # ============================================================
-def suggest_improvements(
-    req: Requirement,
-    issues: Sequence[Issue],
+def iter_suggestions_batch(
+    items: Sequence[SuggestionItem],
     *,
+    batch_size: int = 10,
     max_suggestions: int = 3,
     model: Optional[str] = None,
+    use_cache: bool = True,
     verbose: bool = False,
-) -> List[Suggestion]:
+) -> Iterator[Tuple[int, List[Suggestion]]]:
     """
-    Retourne une liste de Suggestion (source=AI), ou [] si IA désactivée/indisponible.
+    Variante streaming : produit (index dans `items`, suggestions) dès qu'une tranche est traitée.
+
+    Un appel API par tranche de `batch_size`, tranches exécutées en parallèle
+    (ThreadPoolExecutor borné par QRA_AI_WORKERS) ; l'ordre de sortie suit l'ordre
+    de complétion, pas l'ordre d'entrée. Les exigences sans suggestion peuvent être omises.
+    Les exigences de contenu identique (hors req_id) ne sont envoyées qu'une fois ;
+    celles déjà présentes dans le cache disque (use_cache=True) ne sont pas renvoyées.
 
     Contrats :
       - Non bloquant : aucune exception ne remonte
@@ -171,6 +533,9 @@ def suggest_improvements(
     if verbose:
         log.setLevel(logging.DEBUG)
 
+    if not items:
+        return
+
     if not is_ai_enabled():
         enable_ai_env = (os.getenv("ENABLE_AI", "0") or "").strip().lower()
         has_key = bool((os.getenv("OPENAI_API_KEY") or "").strip())
@@ -178,58 +543,131 @@ def suggest_improvements(
             log.warning("AI requested (ENABLE_AI=1) but OPENAI_API_KEY missing -> fallback []")
         else:
             log.debug("AI disabled -> fallback []")
-        return []
+        return
 
     try:
-        from openai import OpenAI  # type: ignore
-    except Exception:
+        client = _get_client()
+    except ImportError:
         log.warning("openai-python not installed -> fallback []")
-        return []
+        return
+    except Exception as e:
+        log.warning(f"AI client init failed -> fallback [] ({e})")
+        return
 
     used_model = (model or _get_model()).strip()
-    prompt = _build_prompt(req, issues, max_suggestions=max_suggestions)
 
-    try:
-        client = OpenAI()
-        resp = client.responses.create(model=used_model, input=prompt)
+    # Dédup intra-run : un seul envoi par contenu identique, résultat recopié vers les doublons
+    groups: Dict[str, List[int]] = {}
+    for idx, (req, issues) in enumerate(items):
+        groups.setdefault(_item_key(req, issues), []).append(idx)
+    unique = [(members[0], items[members[0]]) for members in groups.values()]
+    cache_keys: Optional[Dict[int, str]] = (
+        {members[0]: _item_cache_key(used_model, key, max_suggestions) for key, members in groups.items()}
+        if use_cache
+        else None
+    )
+    duplicates = {members[0]: members[1:] for members in groups.values() if len(members) > 1}
+    if duplicates:
+        log.debug(f"AI dedup: {len(items)} items -> {len(unique)} unique prompts")
+
+    def _fan_out(chunk_results: List[Tuple[int, List[Suggestion]]]) -> Iterator[Tuple[int, List[Suggestion]]]:
+        for idx, suggestions in chunk_results:
+            yield idx, suggestions
+            for dup_idx in duplicates.get(idx, ()):
+                yield dup_idx, list(suggestions)
+
+    pending = unique
+    if cache_keys:
+        hits, pending = _cached_results(unique, cache_keys, max_suggestions)
+        if hits:
+            log.debug(f"AI cache: {len(hits)} hit(s), {len(pending)} to send")
+            yield from _fan_out(hits)
+
+    chunks = list(_chunked(pending, batch_size))
+    workers = min(_max_workers(), len(chunks))
+
+    if workers <= 1:
+        for chunk in chunks:
+            yield from _fan_out(_run_chunk(client, used_model, chunk, max_suggestions, cache_keys))
+        return
+
+    # Appels réseau (I/O-bound) : fan-out borné, parsing d'une tranche pendant que les autres sont en vol
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="qra-ai") as ex:
+        futures = [ex.submit(_run_chunk, client, used_model, chunk, max_suggestions, cache_keys) for chunk in chunks]
+        for fut in as_completed(futures):
+            try:
+                chunk_results = fut.result()
+            except Exception as e:
+                log.warning(f"AI chunk failed -> fallback [] ({e})")
+                continue
+            yield from _fan_out(chunk_results)
 
-        output_text = (getattr(resp, "output_text", None) or "").strip()
-        if not output_text:
-            output_text = str(resp).strip()
 
-        try:
-            data = _safe_parse_json(output_text)
-        except Exception as e:
-            log.warning(f"AI returned invalid JSON -> fallback [] ({e})")
-            return []
+def suggest_improvements_batch(
+    items: Sequence[SuggestionItem],
+    *,
+    batch_size: int = 10,
+    max_suggestions: int = 3,
+    model: Optional[str] = None,
+    use_cache: bool = True,
+    verbose: bool = False,
+) -> List[List[Suggestion]]:
+    """
+    Suggestions IA pour plusieurs exigences (voir iter_suggestions_batch).
 
-        raw = data.get("suggestions", [])
-        if not isinstance(raw, list):
-            log.warning("AI JSON invalid: 'suggestions' is not a list -> fallback []")
-            return []
+    Args:
+        items: séquence de (Requirement, issues)
+        batch_size: nombre max d'exigences par prompt
+        max_suggestions: nombre max de suggestions par exigence
+        use_cache: relire/écrire le cache disque des réponses (QRA_AI_CACHE_*)
 
-        out: List[Suggestion] = []
-        for item in raw[:max_suggestions]:
-            if not isinstance(item, dict):
-                continue
-            msg = (item.get("message") or "").strip()
-            if not msg:
-                continue
-            rationale = (item.get("rationale") or "").strip()
-            conf = item.get("confidence", None)
-
-            out.append(
-                Suggestion(
-                    source=SuggestionSource.AI,
-                    message=msg,
-                    rule_id="AI-001",
-                    rationale=rationale,
-                    confidence=conf if isinstance(conf, (int, float)) else None,
-                )
-            )
+    Returns:
+        Liste alignée sur `items` : une liste de Suggestion (source=AI) par exigence,
+        [] si IA désactivée/indisponible ou si l'exigence est absente de la réponse.
+    """
+    results: List[List[Suggestion]] = [[] for _ in items]
+    try:
+        for idx, suggestions in iter_suggestions_batch(
+            items,
+            batch_size=batch_size,
+            max_suggestions=max_suggestions,
+            model=model,
+            use_cache=use_cache,
+            verbose=verbose,
+        ):
+            results[idx] = suggestions
+    except Exception as e:
+        log.warning(f"AI suggestions interrupted -> partial fallback ({e})")
+    return results
 
-        return out
 
+def suggest_improvements(
+    req: Requirement,
+    issues: Sequence[Issue],
+    *,
+    max_suggestions: int = 3,
+    model: Optional[str] = None,
+    use_cache: bool = True,
+    verbose: bool = False,
+) -> List[Suggestion]:
+    """
+    Retourne une liste de Suggestion (source=AI), ou [] si IA désactivée/indisponible.
+
+    Wrapper mono-exigence de suggest_improvements_batch().
+
+    Contrats :
+      - Non bloquant : aucune exception ne remonte
+      - Suggestion-only : ne modifie jamais l'exigence
+    """
+    try:
+        return suggest_improvements_batch(
+            [(req, issues)],
+            batch_size=1,
+            max_suggestions=max_suggestions,
+            model=model,
+            use_cache=use_cache,
+            verbose=verbose,
+        )[0]
     except Exception as e:
         log.warning(f"AI call failed -> fallback [] ({e})")
         return []
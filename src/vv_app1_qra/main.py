@@ -27,6 +27,8 @@ Usage CLI :
     python -m vv_app1_qra.main --out-dir data/outputs --verbose
     python -m vv_app1_qra.main --input data/inputs/demo_input.csv --out-dir data/outputs
     python -m vv_app1_qra.main --fail-on-empty
+    python -m vv_app1_qra.main --input big.csv --jobs 4
+    python -m vv_app1_qra.main --no-ai-cache
 
 Mode IA (standard portfolio) :
     . .\\tools\\load_env_secret.ps1
@@ -49,14 +51,21 @@ import datetime as dt
 import json
 import logging
 import os
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
 
-from vv_app1_qra.ia_assistant import suggest_improvements
+try:  # accélération JSON optionnelle (pip install -e ".[fast]")
+    import orjson  # type: ignore
+except ImportError:  # pragma: no cover - dépend de l'environnement
+    orjson = None  # type: ignore[assignment]
+
+from vv_app1_qra.ia_assistant import iter_suggestions_batch
 from vv_app1_qra.models import AnalysisResult, Requirement, SuggestionSource
 from vv_app1_qra.report import generate_csv_report, generate_html_report
-from vv_app1_qra.rules import analyze_requirement
+from vv_app1_qra.rules import PARALLEL_MIN_ROWS, analyze_requirements
 
 # ============================================================
 # 🧾 Logging (local, autonome)
@@ -90,7 +99,7 @@ class ModuleError(Exception):
 # ============================================================
 # 🧩 Modèle de données (optionnel)
 # ============================================================
-@dataclass
+@dataclass(slots=True)
 class ProcessResult:
     """
     Structure de sortie standardisée pour le run CLI.
@@ -107,19 +116,69 @@ def _normalize_header(s: str) -> str:
     return (s or "").strip().lower()
 
 
-def _pick_first(row: Dict[str, str], keys: List[str], default: str = "") -> str:
-    for k in keys:
-        v = (row.get(k) or "").strip()
-        if v:
-            return v
+# Champ logique -> alias de colonnes acceptés (ordre = priorité)
+_COLUMN_ALIASES: Dict[str, Tuple[str, ...]] = {
+    "req_id": ("req_id", "id", "requirement_id"),
+    "text": ("requirement_text", "text", "requirement", "description", "content"),
+    "title": ("title", "summary"),
+    "source": ("source", "tool", "origin"),
+    "acceptance_criteria": ("acceptance_criteria", "ac"),
+    "verification_method": ("verification_method", "verification"),
+    "rationale": ("rationale",),
+    "system": ("system",),
+    "component": ("component",),
+    "priority": ("priority",),
+}
+
+
+# Ordre des champs d'un enregistrement CSV normalisé (= ordre des champs de Requirement)
+_RECORD_FIELDS: Tuple[str, ...] = (
+    "req_id",
+    "title",
+    "text",
+    "source",
+    "system",
+    "component",
+    "priority",
+    "rationale",
+    "verification_method",
+    "acceptance_criteria",
+)
+
+
+def _build_column_index(header: Sequence[str]) -> Dict[str, Tuple[int, ...]]:
+    """
+    Calcule UNE fois par fichier, pour chaque champ logique, les index de colonnes candidates
+    (ordre de priorité des alias). En cas d'en-têtes dupliqués, la dernière colonne l'emporte.
+    """
+    positions: Dict[str, int] = {}
+    for i, name in enumerate(header):
+        positions[_normalize_header(name)] = i
+
+    return {
+        field_name: tuple(positions[alias] for alias in aliases if alias in positions)
+        for field_name, aliases in _COLUMN_ALIASES.items()
+    }
+
+
+def _pick(values: Sequence[str], cols: Tuple[int, ...], default: str = "") -> str:
+    """Première valeur non vide parmi les colonnes candidates (index précalculés)."""
+    n = len(values)
+    for i in cols:
+        if i < n:
+            v = (values[i] or "").strip()
+            if v:
+                return v
     return default
 
 
-def load_requirements_csv(input_path: Path) -> List[Dict[str, str]]:
+def _iter_csv_records(input_path: Path) -> Iterator[Tuple[str, ...]]:
     """
-    Charge des exigences depuis un CSV.
+    Lit un CSV d'exigences ligne à ligne (générateur) et produit des enregistrements normalisés :
+    tuples dans l'ordre _RECORD_FIELDS (pas de dict alloué par ligne).
 
     Supporte plusieurs schémas (tolérant).
+    Le mapping colonnes -> champs est résolu une seule fois à partir de l'en-tête.
 
     Schéma "demo_input.csv" (APP1) :
       - req_id
@@ -141,186 +200,210 @@ def load_requirements_csv(input_path: Path) -> List[Dict[str, str]]:
         raise ModuleError(f"Input file not found: {input_path}")
 
     with input_path.open("r", encoding="utf-8-sig", newline="") as f:
-        reader = csv.DictReader(f)
-        if not reader.fieldnames:
+        reader = csv.reader(f)
+        header = next(reader, None)
+        if not header:
             raise ModuleError("CSV has no header row (fieldnames missing).")
 
-        rows: List[Dict[str, str]] = []
+        cols = _build_column_index(header)
+        c_req_id = cols["req_id"]
+        c_text = cols["text"]
+        c_title = cols["title"]
+        c_source = cols["source"]
+        c_ac = cols["acceptance_criteria"]
+        c_vm = cols["verification_method"]
+        c_rationale = cols["rationale"]
+        c_system = cols["system"]
+        c_component = cols["component"]
+        c_priority = cols["priority"]
+
         idx = 0
 
-        for raw in reader:
+        for values in reader:
+            if not values:
+                continue  # ligne vide (même comportement que DictReader)
             idx += 1
-            norm = {_normalize_header(k): (v or "").strip() for k, v in raw.items() if k is not None}
 
-            req_id = _pick_first(norm, ["req_id", "id", "requirement_id"], default=f"REQ-{idx:03d}")
+            req_id = _pick(values, c_req_id, default=f"REQ-{idx:03d}")
+            text = _pick(values, c_text)
 
-            text = _pick_first(
-                norm,
-                ["requirement_text", "text", "requirement", "description", "content"],
-                default="",
-            )
+            system = _pick(values, c_system)
+            component = _pick(values, c_component)
+            priority = _pick(values, c_priority)
 
-            title = _pick_first(norm, ["title", "summary"], default="")
+            title = _pick(values, c_title)
             if not title:
-                system = _pick_first(norm, ["system"], default="")
-                component = _pick_first(norm, ["component"], default="")
-                priority = _pick_first(norm, ["priority"], default="")
-                parts = [p for p in [system, component, priority] if p]
-                title = " / ".join(parts)
-
-            source = _pick_first(norm, ["source", "tool", "origin"], default="demo")
-
-            acceptance_criteria = _pick_first(norm, ["acceptance_criteria", "ac"], default="")
-            verification_method = _pick_first(norm, ["verification_method", "verification"], default="")
-            rationale = _pick_first(norm, ["rationale"], default="")
-
-            system = _pick_first(norm, ["system"], default="")
-            component = _pick_first(norm, ["component"], default="")
-            priority = _pick_first(norm, ["priority"], default="")
+                title = " / ".join(p for p in (system, component, priority) if p)
 
             if not title and not text:
-                log.warning(f"Row {idx}: empty requirement (no title/text) -> skipped")
+                log.warning("Row %d: empty requirement (no title/text) -> skipped", idx)
                 continue
 
-            rows.append(
-                {
-                    "req_id": req_id,
-                    "title": title,
-                    "text": text,
-                    "source": source,
-                    "system": system,
-                    "component": component,
-                    "priority": priority,
-                    "verification_method": verification_method,
-                    "acceptance_criteria": acceptance_criteria,
-                    "rationale": rationale,
-                }
+            yield (
+                req_id,
+                title,
+                text,
+                _pick(values, c_source, default="demo"),
+                system,
+                component,
+                priority,
+                _pick(values, c_rationale),
+                _pick(values, c_vm),
+                _pick(values, c_ac),
             )
 
-        return rows
+
+def _iter_csv_rows(input_path: Path) -> Iterator[Dict[str, str]]:
+    """Lignes normalisées (dict) construites à partir des enregistrements tuples."""
+    for rec in _iter_csv_records(input_path):
+        yield dict(zip(_RECORD_FIELDS, rec))
 
 
-def _row_to_requirement(row: Dict[str, str]) -> Requirement:
+def load_requirements_csv(input_path: Path) -> List[Dict[str, str]]:
     """
-    Convertit une ligne normalisée (dict) en Requirement (modèle domaine).
-    Lève ValueError si invalide (contrat Requirement.__post_init__).
+    Charge des exigences depuis un CSV (liste de lignes normalisées).
+    Voir _iter_csv_records() pour les schémas supportés.
     """
-    return Requirement(
-        req_id=row.get("req_id", ""),
-        title=row.get("title", ""),
-        text=row.get("text", ""),
-        source=row.get("source", "demo"),
-        system=row.get("system", ""),
-        component=row.get("component", ""),
-        priority=row.get("priority", ""),
-        rationale=row.get("rationale", ""),
-        verification_method=row.get("verification_method", ""),
-        acceptance_criteria=row.get("acceptance_criteria", ""),
-        meta={},  # réservé (extensions futures)
-    )
+    return list(_iter_csv_rows(input_path))
+
+
+def iter_requirements_csv(input_path: Path) -> Iterator[Requirement]:
+    """
+    Itère les exigences d'un CSV sans matérialiser le fichier (streaming ligne -> Requirement).
+
+    Raises:
+        ModuleError: fichier absent / sans en-tête / exigence invalide (numéro de ligne valide)
+    """
+    for idx, rec in enumerate(_iter_csv_records(input_path), start=1):
+        try:
+            # rec est déjà normalisé par le lecteur (trim, défauts, req_id/title/text) : pas de re-normalisation
+            yield Requirement._from_normalized(rec)
+        except Exception as e:
+            raise ModuleError(f"Invalid requirement at row#{idx}: {e}") from e
 
 
 # ============================================================
 # 🧾 Outputs legacy (compat)
 # ============================================================
-def write_output_csv(out_path: Path, analyses: List[AnalysisResult]) -> None:
+_json_encode = json.JSONEncoder(ensure_ascii=False, separators=(",", ":")).encode
+
+
+def _json_compact_dumps(obj: Any) -> str:
+    """JSON compact UTF-8 (orjson si disponible, sinon stdlib ; même format de sortie)."""
+    if orjson is not None:
+        return orjson.dumps(obj).decode("utf-8")
+    return _json_encode(obj)
+
+
+# Tampon d'écriture des sorties legacy (moins d'appels système write sur les gros volumes)
+_WRITE_BUFFER_BYTES = 1 << 20
+
+_LEGACY_CSV_FIELDNAMES: Tuple[str, ...] = (
+    "req_id",
+    "title",
+    "text",
+    "source",
+    "system",
+    "component",
+    "priority",
+    "verification_method",
+    "acceptance_criteria",
+    "status",
+    "score",
+    "issues_count",
+    "suggestions_count",
+    "issues_json",
+    "suggestions_json",
+)
+
+
+class _LegacyCsvWriter:
+    """
+    Writer CSV legacy en streaming (context manager) : en-tête à l'ouverture, une ligne par write_row().
+    Le dossier parent est créé si besoin.
     """
-    Écrit un CSV enrichi (legacy) :
+
+    def __init__(self, out_path: Path) -> None:
+        self._out_path = out_path
+        self._f: Any = None
+        self._writer: Any = None
+
+    def __enter__(self) -> "_LegacyCsvWriter":
+        self._out_path.parent.mkdir(parents=True, exist_ok=True)
+        self._f = self._out_path.open("w", encoding="utf-8", newline="", buffering=_WRITE_BUFFER_BYTES)
+        self._writer = csv.writer(self._f)
+        self._writer.writerow(_LEGACY_CSV_FIELDNAMES)
+        return self
+
+    def write_row(self, a: AnalysisResult) -> None:
+        dumps = _json_compact_dumps
+        req = a.requirement
+        self._writer.writerow(
+            (
+                req.req_id,
+                req.title,
+                req.text,
+                req.source,
+                req.system,
+                req.component,
+                req.priority,
+                req.verification_method,
+                req.acceptance_criteria,
+                a.status,
+                "" if a.score is None else a.score,
+                len(a.issues),
+                len(a.suggestions),
+                dumps([i.to_dict() for i in a.issues]),
+                dumps([s.to_dict() for s in a.suggestions]),
+            )
+        )
+
+    def __exit__(self, *exc: Any) -> None:
+        self._f.close()
+
+
+def open_csv_writer(out_path: Path) -> _LegacyCsvWriter:
+    """
+    Ouvre un writer CSV legacy (à utiliser avec `with`) :
       - status/score
       - issues_count/suggestions_count
       - issues_json/suggestions_json (compact JSON)
     """
-    out_path.parent.mkdir(parents=True, exist_ok=True)
-
-    fieldnames = [
-        "req_id",
-        "title",
-        "text",
-        "source",
-        "system",
-        "component",
-        "priority",
-        "verification_method",
-        "acceptance_criteria",
-        "status",
-        "score",
-        "issues_count",
-        "suggestions_count",
-        "issues_json",
-        "suggestions_json",
-    ]
-
-    with out_path.open("w", encoding="utf-8", newline="") as f:
-        writer = csv.DictWriter(f, fieldnames=fieldnames)
-        writer.writeheader()
+    return _LegacyCsvWriter(out_path)
 
+
+def write_output_csv(out_path: Path, analyses: List[AnalysisResult]) -> None:
+    """
+    Écrit un CSV enrichi (legacy) en une fois (voir open_csv_writer).
+    """
+    with open_csv_writer(out_path) as w:
         for a in analyses:
-            req = a.requirement
-            issues_json = json.dumps([i.to_dict() for i in a.issues], ensure_ascii=False, separators=(",", ":"))
-            suggs_json = json.dumps([s.to_dict() for s in a.suggestions], ensure_ascii=False, separators=(",", ":"))
+            w.write_row(a)
 
-            writer.writerow(
-                {
-                    "req_id": req.req_id,
-                    "title": req.title,
-                    "text": req.text,
-                    "source": req.source,
-                    "system": req.system,
-                    "component": req.component,
-                    "priority": req.priority,
-                    "verification_method": req.verification_method,
-                    "acceptance_criteria": req.acceptance_criteria,
-                    "status": a.status,
-                    "score": "" if a.score is None else a.score,
-                    "issues_count": len(a.issues),
-                    "suggestions_count": len(a.suggestions),
-                    "issues_json": issues_json,
-                    "suggestions_json": suggs_json,
-                }
-            )
+
+# Table d'échappement HTML (un seul passage str.translate, même sortie que l'ancienne chaîne de replace)
+_HTML_ESCAPE_TABLE = str.maketrans({"&": "&amp;", "<": "&lt;", ">": "&gt;", '"': "&quot;"})
 
 
 def _html_escape(s: str) -> str:
-    return (
-        (s or "")
-        .replace("&", "&amp;")
-        .replace("<", "&lt;")
-        .replace(">", "&gt;")
-        .replace('"', "&quot;")
-    )
+    return (s or "").translate(_HTML_ESCAPE_TABLE)
 
 
-def write_output_html(out_path: Path, analyses: List[AnalysisResult]) -> None:
-    """
-    Génère un HTML standalone minimal (legacy) ouvrable localement.
-    """
-    out_path.parent.mkdir(parents=True, exist_ok=True)
-
-    def _issues_summary(a: AnalysisResult) -> str:
-        if not a.issues:
-            return '<span style="color:#2e7d32;font-weight:bold">OK</span>'
-        items = "".join(
-            f"<li><b>{_html_escape(i.rule_id)}</b> [{_html_escape(i.severity.value)}] — {_html_escape(i.message)}</li>"
-            for i in a.issues
-        )
-        return f"<ul style='margin:0;padding-left:18px'>{items}</ul>"
-
-    rows = "\n".join(
-        f"""
-        <tr>
-          <td>{_html_escape(a.requirement.req_id)}</td>
-          <td>{_html_escape(a.requirement.title)}</td>
-          <td style="white-space:pre-wrap">{_html_escape(a.requirement.text)}</td>
-          <td>{_html_escape(a.requirement.source)}</td>
-          <td>{_html_escape(a.status)}</td>
-          <td style="text-align:right">{"" if a.score is None else a.score}</td>
-          <td>{_issues_summary(a)}</td>
-        </tr>
-        """.strip()
-        for a in analyses
-    )
+# Ligne <tr> du HTML legacy (gabarit positionnel, rempli via str.format)
+_LEGACY_ROW_TMPL = (
+    "<tr>\n"
+    "          <td>{}</td>\n"
+    "          <td>{}</td>\n"
+    '          <td class="pre">{}</td>\n'
+    "          <td>{}</td>\n"
+    "          <td>{}</td>\n"
+    '          <td class="num">{}</td>\n'
+    "          <td>{}</td>\n"
+    "        </tr>"
+)
+
 
-    html = f"""<!doctype html>
+_LEGACY_HTML_HEAD = """<!doctype html>
 <html lang="fr">
 <head>
   <meta charset="utf-8"/>
@@ -334,6 +417,10 @@ def write_output_html(out_path: Path, analyses: List[AnalysisResult]) -> None:
     th, td {{ border: 1px solid #ddd; padding: 8px; vertical-align: top; }}
     th {{ background: #f0f0f0; text-align: left; }}
     .meta {{ color:#555; margin: 10px 0 18px 0; }}
+    td.pre {{ white-space: pre-wrap; }}
+    td.num {{ text-align: right; }}
+    .ok {{ color:#2e7d32; font-weight: bold; }}
+    ul.issues {{ margin:0; padding-left:18px; }}
   </style>
 </head>
 <body>
@@ -343,7 +430,7 @@ def write_output_html(out_path: Path, analyses: List[AnalysisResult]) -> None:
   </header>
 
   <div class="meta">
-    Généré le {dt.datetime.now().strftime("%Y-%m-%d %H:%M:%S")} — Exigences analysées : {len(analyses)}
+    Généré le {generated_at} — Exigences analysées : {count}
   </div>
 
   <table>
@@ -354,13 +441,117 @@ def write_output_html(out_path: Path, analyses: List[AnalysisResult]) -> None:
       </tr>
     </thead>
     <tbody>
-      {rows}
+      """
+
+_LEGACY_HTML_TS_FMT = "%Y-%m-%d %H:%M:%S"
+
+# Horodatage des noms de fichiers legacy (qra_output_<stamp>.csv/.html)
+_OUTPUT_STAMP_FMT = "%Y%m%d_%H%M%S"
+
+_LEGACY_HTML_TAIL = """
     </tbody>
   </table>
 </body>
 </html>
 """
-    out_path.write_text(html, encoding="utf-8")
+
+
+def _issues_summary(a: AnalysisResult) -> str:
+    if not a.issues:
+        return '<span class="ok">OK</span>'
+    items = "".join(
+        f"<li><b>{_html_escape(i.rule_id)}</b> [{_html_escape(i.severity.value)}] — {_html_escape(i.message)}</li>"
+        for i in a.issues
+    )
+    return f"<ul class='issues'>{items}</ul>"
+
+
+class _LegacyHtmlWriter:
+    """
+    Writer HTML legacy en streaming (context manager) :
+    en-tête + ouverture du tableau à l'entrée, une <tr> par write_row(), fermeture à la sortie.
+    Le dossier parent est créé si besoin.
+    """
+
+    def __init__(self, out_path: Path, count: int) -> None:
+        self._out_path = out_path
+        self._count = count
+        self._f: Any = None
+        self._sep = ""
+
+    def __enter__(self) -> "_LegacyHtmlWriter":
+        self._out_path.parent.mkdir(parents=True, exist_ok=True)
+        self._f = self._out_path.open("w", encoding="utf-8", buffering=_WRITE_BUFFER_BYTES)
+        self._f.write(
+            _LEGACY_HTML_HEAD.format(
+                generated_at=dt.datetime.now().strftime(_LEGACY_HTML_TS_FMT),
+                count=self._count,
+            )
+        )
+        return self
+
+    def write_row(self, a: AnalysisResult) -> None:
+        esc = _html_escape
+        self._f.write(
+            self._sep
+            + _LEGACY_ROW_TMPL.format(
+                esc(a.requirement.req_id),
+                esc(a.requirement.title),
+                esc(a.requirement.text),
+                esc(a.requirement.source),
+                esc(a.status),
+                "" if a.score is None else a.score,
+                _issues_summary(a),
+            )
+        )
+        self._sep = "\n"
+
+    def __exit__(self, *exc: Any) -> None:
+        try:
+            self._f.write(_LEGACY_HTML_TAIL)
+        finally:
+            self._f.close()
+
+
+def open_html_writer(out_path: Path, count: int) -> _LegacyHtmlWriter:
+    """
+    Ouvre un writer HTML standalone minimal (legacy), ouvrable localement (à utiliser avec `with`).
+    `count` = nombre d'exigences annoncé dans l'en-tête.
+    """
+    return _LegacyHtmlWriter(out_path, count)
+
+
+def write_output_html(out_path: Path, analyses: List[AnalysisResult]) -> None:
+    """
+    Génère un HTML standalone minimal (legacy) en une fois (voir open_html_writer).
+    """
+    with open_html_writer(out_path, len(analyses)) as w:
+        for a in analyses:
+            w.write_row(a)
+
+
+# ============================================================
+# 🧮 Règles (séquentiel / multiprocessing)
+# ============================================================
+def _default_jobs() -> int:
+    return max(1, (os.cpu_count() or 2) // 2)
+
+
+def _analyze_all(
+    requirements: Iterable[Requirement],
+    *,
+    jobs: int = 1,
+    verbose: bool = False,
+    min_parallel: int = PARALLEL_MIN_ROWS,
+) -> List[AnalysisResult]:
+    """
+    Applique les règles déterministes à toutes les exigences (ordre d'entrée conservé).
+
+    - jobs <= 1 : séquentiel, streaming depuis l'itérable
+    - jobs > 1  : pool de processus, seulement si le volume atteint `min_parallel`
+                  (voir rules.analyze_requirements)
+    """
+    return analyze_requirements(requirements, verbose=verbose, workers=jobs, min_parallel=min_parallel)
 
 
 # ============================================================
@@ -369,7 +560,7 @@ def write_output_html(out_path: Path, analyses: List[AnalysisResult]) -> None:
 def process(data: Dict[str, Any]) -> ProcessResult:
     """
     Pipeline QRA :
-      1) charge CSV
+      1) charge CSV (streaming ligne à ligne)
       2) map -> Requirement
       3) règles déterministes
       4) suggestions IA optionnelles (non bloquantes)
@@ -383,6 +574,8 @@ def process(data: Dict[str, Any]) -> ProcessResult:
         out_dir = Path(str(data.get("out_dir", os.getenv("OUTPUT_DIR", "data/outputs"))))
         fail_on_empty = bool(data.get("fail_on_empty", False))
         verbose = bool(data.get("verbose", False))
+        jobs = max(1, int(data.get("jobs", 1) or 1))
+        ai_cache = bool(data.get("ai_cache", True))
 
         if verbose:
             log.setLevel(logging.DEBUG)
@@ -398,51 +591,44 @@ def process(data: Dict[str, Any]) -> ProcessResult:
             f"(ENABLE_AI={enable_ai_env}, key={'yes' if has_key else 'no'})"
         )
 
-        # 1) Load raw rows
-        rows = load_requirements_csv(input_path)
-        if fail_on_empty and not rows:
+        # 1-3) Load -> Requirement -> rules (streaming si séquentiel ; pool de processus si --jobs > 1)
+        log.info(f"Rules   : enabled (1.8.2) — jobs={jobs}")
+        analyses = _analyze_all(iter_requirements_csv(input_path), jobs=jobs, verbose=verbose)
+        if fail_on_empty and not analyses:
             raise ModuleError("Empty dataset (0 valid requirements).")
 
-        # 2) Map rows -> Requirement
-        requirements: List[Requirement] = []
-        for idx, row in enumerate(rows, start=1):
-            try:
-                requirements.append(_row_to_requirement(row))
-            except Exception as e:
-                raise ModuleError(f"Invalid requirement at row#{idx}: {e}") from e
-
-        log.info("Rules   : enabled (1.8.2)")
-
-        # 3) Analyze (rules)
-        analyses: List[AnalysisResult] = [analyze_requirement(r, verbose=verbose) for r in requirements]
-
         # 3bis) AI suggestions (optional, non-blocking)
         log.info("AI      : optional suggestions (1.9.2)")
         ai_candidates = [a for a in analyses if a.issues]  # ONLY at-risk
         log.info(f"AI      : candidates={len(ai_candidates)}/{len(analyses)} (issues>0)")
 
-        for analysis in ai_candidates:
-            try:
-                ai_suggestions = suggest_improvements(
-                    req=analysis.requirement,
-                    issues=analysis.issues,
-                    max_suggestions=3,
-                    verbose=verbose,
-                )
+        # Résultats consommés au fil des tranches terminées (parsing/merge pendant les appels en vol)
+        try:
+            for idx, ai_suggestions in iter_suggestions_batch(
+                [(a.requirement, a.issues) for a in ai_candidates],
+                batch_size=10,
+                max_suggestions=3,
+                use_cache=ai_cache,
+                verbose=verbose,
+            ):
                 if ai_suggestions:
-                    analysis.suggestions.extend(ai_suggestions)
-            except Exception as e:
-                log.warning(f"AI suggestion skipped for {analysis.requirement.req_id}: {e}")
+                    ai_candidates[idx].suggestions.extend(ai_suggestions)
+        except Exception as e:
+            log.warning(f"AI suggestions skipped: {e}")
 
         # 4) Outputs legacy (CSV + HTML)
-        stamp = dt.datetime.now().strftime("%Y%m%d_%H%M%S")
+        stamp = dt.datetime.now().strftime(_OUTPUT_STAMP_FMT)
         out_dir.mkdir(parents=True, exist_ok=True)
 
         out_csv = out_dir / f"qra_output_{stamp}.csv"
         out_html = out_dir / f"qra_output_{stamp}.html"
 
-        write_output_csv(out_csv, analyses)
-        write_output_html(out_html, analyses)
+        def _write_legacy() -> None:
+            # Une seule traversée pour les deux sorties legacy
+            with open_csv_writer(out_csv) as csv_w, open_html_writer(out_html, len(analyses)) as html_w:
+                for a in analyses:
+                    csv_w.write_row(a)
+                    html_w.write_row(a)
 
         # 4bis) Rapport HTML/CSV QRA structuré (stable paths)
         qra_report_path = out_dir / "qra_report.html"
@@ -455,29 +641,47 @@ def process(data: Dict[str, Any]) -> ProcessResult:
                 return "À risque"
             return a.status
 
-        qra_result = {
-            "requirements": [
+        # Une seule passe : lignes du rapport + score global + statut global
+        report_rows: List[Dict[str, Any]] = []
+        score_sum = 0
+        score_count = 0
+        any_risk = False
+        for a in analyses:
+            display_status = _display_status(a)
+            if display_status != "OK":
+                any_risk = True
+            score = a.score
+            if type(score) is int:  # exclut bool (isinstance(True, int) est vrai)
+                score_sum += score
+                score_count += 1
+            req = a.requirement
+            report_rows.append(
                 {
-                    "id": a.requirement.req_id,
-                    "text": a.requirement.text,
-                    "score": a.score,
+                    "id": req.req_id,
+                    "text": req.text,
+                    "score": score,
                     "raw_status": a.status,
-                    "display_status": _display_status(a),
+                    "display_status": display_status,
                     "issues": [{"severity": i.severity.value, "message": i.message} for i in a.issues],
                     "ai_suggestions": [s.message for s in a.suggestions if s.source == SuggestionSource.AI],
                 }
-                for a in analyses
-            ],
-            "global_score": (
-                round(sum(valid_scores) / len(valid_scores), 1)
-                if (valid_scores := [a.score for a in analyses if isinstance(a.score, int)])
-                else 0.0
-            ),
-            "global_status": "OK" if all(_display_status(a) == "OK" for a in analyses) else "À risque",
+            )
+
+        qra_result = {
+            "requirements": report_rows,
+            "global_score": round(score_sum / score_count, 1) if score_count else 0.0,
+            "global_status": "À risque" if any_risk else "OK",
         }
 
-        generate_html_report(qra_result=qra_result, output_path=qra_report_path, verbose=verbose)
-        generate_csv_report(qra_result=qra_result, output_path=qra_report_csv_path, verbose=verbose)
+        # 4ter) Écritures indépendantes (fichiers distincts, données en lecture seule) : threads I/O
+        with ThreadPoolExecutor(max_workers=3, thread_name_prefix="qra-out") as ex:
+            futures = [
+                ex.submit(_write_legacy),
+                ex.submit(generate_html_report, qra_result=qra_result, output_path=qra_report_path, verbose=verbose),
+                ex.submit(generate_csv_report, qra_result=qra_result, output_path=qra_report_csv_path, verbose=verbose),
+            ]
+            for fut in futures:
+                fut.result()  # propage la première erreur d'écriture
 
         # 5) Payload final
         payload = {
@@ -506,7 +710,12 @@ def process(data: Dict[str, Any]) -> ProcessResult:
 # ============================================================
 # ▶️ Main (CLI)
 # ============================================================
+@lru_cache(maxsize=1)
 def _build_parser() -> argparse.ArgumentParser:
+    """
+    Parser CLI construit une fois par process (defaults lus à la première construction :
+    OUTPUT_DIR, cpu_count) ; `_build_parser.cache_clear()` pour le reconstruire.
+    """
     p = argparse.ArgumentParser(
         prog="vv-app1-qra",
         description=(
@@ -533,6 +742,20 @@ def _build_parser() -> argparse.ArgumentParser:
         help="Fail (non-zero) if no valid requirement is loaded.",
     )
 
+    p.add_argument(
+        "--jobs",
+        type=int,
+        default=_default_jobs(),
+        help="Worker processes for the deterministic rules stage (default: cpu_count/2; 1 = sequential).",
+    )
+
+    p.add_argument(
+        "--no-ai-cache",
+        dest="ai_cache",
+        action="store_false",
+        help="Ignore the on-disk AI response cache (always call the API).",
+    )
+
     p.add_argument(
         "--verbose",
         action="store_true",
@@ -549,6 +772,8 @@ def main() -> None:
             "input_path": args.input,
             "out_dir": args.out_dir,
             "fail_on_empty": args.fail_on_empty,
+            "jobs": args.jobs,
+            "ai_cache": args.ai_cache,
             "verbose": args.verbose,
         }
     )
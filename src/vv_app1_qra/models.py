@@ -20,6 +20,7 @@ Rôle :
 Contraintes :
     - stdlib only
     - modèles "data-only" (pas de logique métier de règles ici)
+    - dataclasses frozen + slots (pas de __dict__ par instance)
 ============================================================
 """
 
@@ -28,9 +29,11 @@ from __future__ import annotations
 # ============================================================
 # 📦 Imports
 # ============================================================
+import sys
 from dataclasses import dataclass, field
 from enum import Enum
-from typing import Any, Dict, List, Optional
+from functools import lru_cache
+from typing import Any, Dict, List, Optional, Sequence
 
 # ============================================================
 # 🔎 Public exports
@@ -62,6 +65,11 @@ class SuggestionSource(str, Enum):
     HUMAN = "HUMAN"
 
 
+# Valeurs texte précalculées (to_dict) : lookup dict au lieu du descripteur Enum.value
+_SEVERITY_VALUES: Dict[IssueSeverity, str] = {m: m.value for m in IssueSeverity}
+_SOURCE_VALUES: Dict[SuggestionSource, str] = {m: m.value for m in SuggestionSource}
+
+
 # ============================================================
 # 🔧 Helpers (validation / mapping)
 # ============================================================
@@ -70,6 +78,16 @@ def _s(v: Any) -> str:
     return ("" if v is None else str(v)).strip()
 
 
+def _intern(v: Any) -> Any:
+    """
+    Trim puis interne les valeurs à faible cardinalité (rule_id, category, field).
+
+    Le trim passe avant l'interning : __post_init__ retrouve une valeur déjà propre
+    et la garde telle quelle, l'instance partagée survit donc à la validation.
+    """
+    return sys.intern(_s(v))
+
+
 def _enum_from_str(enum_cls: type[Enum], raw: Any, field_name: str) -> Enum:
     """
     Convertit un champ texte en Enum (strict).
@@ -86,6 +104,12 @@ def _enum_from_str(enum_cls: type[Enum], raw: Any, field_name: str) -> Enum:
     if not s:
         raise ValueError(f"{field_name} is required (got empty).")
 
+    return _enum_lookup(enum_cls, s, field_name)
+
+
+@lru_cache(maxsize=256)
+def _enum_lookup(enum_cls: type[Enum], s: str, field_name: str) -> Enum:
+    """Résolution texte -> Enum mémoïsée (peu de valeurs distinctes ; les échecs ne sont pas mis en cache)."""
     # match valeur
     try:
         return enum_cls(s)  # type: ignore[misc]
@@ -103,7 +127,22 @@ def _enum_from_str(enum_cls: type[Enum], raw: Any, field_name: str) -> Enum:
 # ============================================================
 # 🧩 Modèles
 # ============================================================
-@dataclass(frozen=True)
+# Champs texte de Requirement, dans l'ordre de déclaration (hors meta)
+_REQUIREMENT_TEXT_FIELDS = (
+    "req_id",
+    "title",
+    "text",
+    "source",
+    "system",
+    "component",
+    "priority",
+    "rationale",
+    "verification_method",
+    "acceptance_criteria",
+)
+
+
+@dataclass(frozen=True, slots=True)
 class Requirement:
     """Exigence d'entrée (proche DOORS/Polarion), normalisée."""
     req_id: str
@@ -120,17 +159,20 @@ class Requirement:
     meta: Dict[str, Any] = field(default_factory=dict)
 
     def __post_init__(self) -> None:
-        object.__setattr__(self, "req_id", _s(self.req_id))
-        object.__setattr__(self, "title", _s(self.title))
-        object.__setattr__(self, "text", _s(self.text))
-        object.__setattr__(self, "source", _s(self.source) or "demo")
-
-        object.__setattr__(self, "system", _s(self.system))
-        object.__setattr__(self, "component", _s(self.component))
-        object.__setattr__(self, "priority", _s(self.priority))
-        object.__setattr__(self, "rationale", _s(self.rationale))
-        object.__setattr__(self, "verification_method", _s(self.verification_method))
-        object.__setattr__(self, "acceptance_criteria", _s(self.acceptance_criteria))
+        _set = object.__setattr__
+        for name, value in (
+            ("req_id", _s(self.req_id)),
+            ("title", _s(self.title)),
+            ("text", _s(self.text)),
+            ("source", _s(self.source) or "demo"),
+            ("system", _s(self.system)),
+            ("component", _s(self.component)),
+            ("priority", _s(self.priority)),
+            ("rationale", _s(self.rationale)),
+            ("verification_method", _s(self.verification_method)),
+            ("acceptance_criteria", _s(self.acceptance_criteria)),
+        ):
+            _set(self, name, value)
 
         if not self.req_id:
             raise ValueError("Requirement.req_id must be non-empty.")
@@ -140,6 +182,24 @@ class Requirement:
         if self.meta is None:
             object.__setattr__(self, "meta", {})
 
+    @classmethod
+    def _from_normalized(cls, values: Sequence[str]) -> "Requirement":
+        """
+        Constructeur rapide (usage interne) pour des valeurs DÉJÀ normalisées, dans l'ordre
+        _REQUIREMENT_TEXT_FIELDS (trim fait, source par défaut, req_id et title/text non vides) :
+        saute __post_init__. meta = {}.
+        """
+        if len(values) != len(_REQUIREMENT_TEXT_FIELDS):
+            raise ValueError(
+                f"Requirement._from_normalized expects {len(_REQUIREMENT_TEXT_FIELDS)} values, got {len(values)}."
+            )
+        obj = cls.__new__(cls)
+        _set = object.__setattr__
+        for name, value in zip(_REQUIREMENT_TEXT_FIELDS, values):
+            _set(obj, name, value)
+        _set(obj, "meta", {})
+        return obj
+
     def to_dict(self) -> Dict[str, Any]:
         return {
             "req_id": self.req_id,
@@ -152,7 +212,7 @@ class Requirement:
             "rationale": self.rationale,
             "verification_method": self.verification_method,
             "acceptance_criteria": self.acceptance_criteria,
-            "meta": dict(self.meta or {}),
+            "meta": dict(self.meta) if self.meta else {},
         }
 
     @staticmethod
@@ -174,7 +234,7 @@ class Requirement:
         )
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Issue:
     """Défaut détecté par règle déterministe."""
     rule_id: str
@@ -186,12 +246,16 @@ class Issue:
     recommendation: str = ""
 
     def __post_init__(self) -> None:
-        object.__setattr__(self, "rule_id", _s(self.rule_id))
-        object.__setattr__(self, "category", _s(self.category))
-        object.__setattr__(self, "message", _s(self.message))
-        object.__setattr__(self, "field", _s(self.field))
-        object.__setattr__(self, "evidence", _s(self.evidence))
-        object.__setattr__(self, "recommendation", _s(self.recommendation))
+        _set = object.__setattr__
+        for name, value in (
+            ("rule_id", _s(self.rule_id)),
+            ("category", _s(self.category)),
+            ("message", _s(self.message)),
+            ("field", _s(self.field)),
+            ("evidence", _s(self.evidence)),
+            ("recommendation", _s(self.recommendation)),
+        ):
+            _set(self, name, value)
 
         if not self.rule_id:
             raise ValueError("Issue.rule_id must be non-empty.")
@@ -207,7 +271,7 @@ class Issue:
         return {
             "rule_id": self.rule_id,
             "category": self.category,
-            "severity": self.severity.value,
+            "severity": _SEVERITY_VALUES[self.severity],
             "message": self.message,
             "field": self.field,
             "evidence": self.evidence,
@@ -218,19 +282,21 @@ class Issue:
     def from_dict(d: Dict[str, Any]) -> "Issue":
         if not isinstance(d, dict):
             raise ValueError("Issue.from_dict expects a dict.")
-        sev = _enum_from_str(IssueSeverity, d.get("severity"), "Issue.severity")
+        get = d.get
+        sev = _enum_from_str(IssueSeverity, get("severity"), "Issue.severity")
+        # positionnel, ordre des champs ; sev déjà résolu => __post_init__ ne refait que l'isinstance
         return Issue(
-            rule_id=d.get("rule_id", ""),
-            category=d.get("category", ""),
-            severity=sev,  # type: ignore[arg-type]
-            message=d.get("message", ""),
-            field=d.get("field", ""),
-            evidence=d.get("evidence", ""),
-            recommendation=d.get("recommendation", ""),
+            _intern(get("rule_id", "")),
+            _intern(get("category", "")),
+            sev,  # type: ignore[arg-type]
+            get("message", ""),
+            _intern(get("field", "")),
+            get("evidence", ""),
+            get("recommendation", ""),
         )
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Suggestion:
     """Suggestion (RULE/AI/HUMAN). Non décisionnelle par design."""
     source: SuggestionSource
@@ -240,12 +306,14 @@ class Suggestion:
     confidence: Optional[float] = None
 
     def __post_init__(self) -> None:
-        src = _enum_from_str(SuggestionSource, self.source, "Suggestion.source")
-        object.__setattr__(self, "source", src)  # type: ignore[arg-type]
-
-        object.__setattr__(self, "message", _s(self.message))
-        object.__setattr__(self, "rule_id", _s(self.rule_id))
-        object.__setattr__(self, "rationale", _s(self.rationale))
+        _set = object.__setattr__
+        for name, value in (
+            ("source", _enum_from_str(SuggestionSource, self.source, "Suggestion.source")),
+            ("message", _s(self.message)),
+            ("rule_id", _s(self.rule_id)),
+            ("rationale", _s(self.rationale)),
+        ):
+            _set(self, name, value)
 
         if not self.message:
             raise ValueError("Suggestion.message must be non-empty.")
@@ -258,7 +326,7 @@ class Suggestion:
 
     def to_dict(self) -> Dict[str, Any]:
         return {
-            "source": self.source.value,
+            "source": _SOURCE_VALUES[self.source],
             "message": self.message,
             "rule_id": self.rule_id,
             "rationale": self.rationale,
@@ -269,17 +337,18 @@ class Suggestion:
     def from_dict(d: Dict[str, Any]) -> "Suggestion":
         if not isinstance(d, dict):
             raise ValueError("Suggestion.from_dict expects a dict.")
-        src = _enum_from_str(SuggestionSource, d.get("source"), "Suggestion.source")
+        get = d.get
+        src = _enum_from_str(SuggestionSource, get("source"), "Suggestion.source")
         return Suggestion(
-            source=src,  # type: ignore[arg-type]
-            message=d.get("message", ""),
-            rule_id=d.get("rule_id", ""),
-            rationale=d.get("rationale", ""),
-            confidence=d.get("confidence", None),
+            src,  # type: ignore[arg-type]
+            get("message", ""),
+            get("rule_id", ""),
+            get("rationale", ""),
+            get("confidence"),
         )
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class AnalysisResult:
     """
     Résultat d'analyse pour une exigence :
@@ -305,8 +374,8 @@ class AnalysisResult:
     def to_dict(self) -> Dict[str, Any]:
         return {
             "requirement": self.requirement.to_dict(),
-            "issues": [i.to_dict() for i in self.issues],
-            "suggestions": [s.to_dict() for s in self.suggestions],
+            "issues": list(map(Issue.to_dict, self.issues)),
+            "suggestions": list(map(Suggestion.to_dict, self.suggestions)),
             "score": self.score,
             "status": self.status,
         }
@@ -28,13 +28,15 @@ from __future__ import annotations
 # 📦 Imports
 # ============================================================
 import csv
+import gzip
 import logging
 import os
 from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Dict
+from typing import Any, Dict, Optional
 
-from jinja2 import Environment, FileSystemLoader, select_autoescape
+from jinja2 import Environment, FileSystemLoader, Template, select_autoescape
 
 # ============================================================
 # 🧾 Logging (local, autonome)
@@ -58,9 +60,27 @@ def get_logger(name: str) -> logging.Logger:
 
 log = get_logger(__name__)
 
+# Tampon d'écriture des rapports (rendu streamé : pas de chaîne HTML complète en mémoire)
+_WRITE_BUFFER_BYTES = 1 << 20
+
+# Compression optionnelle du HTML (stdlib uniquement) : niveau 1 = rapide, gain déjà important sur du HTML
+_COMPRESS_LEVELS = {"gz": 1}
+
+_CSV_REPORT_FIELDNAMES = (
+    "id",
+    "score",
+    "raw_status",
+    "display_status",
+    "text",
+    "issues_count",
+    "suggestions_label",
+    "suggestions_count",
+)
+
 # ============================================================
 # 🔧 Helpers
 # ============================================================
+@lru_cache(maxsize=1)
 def _resolve_template_dir() -> Path:
     base_dir = Path(__file__).resolve().parents[2]  # repo root
     template_dir = base_dir / "templates" / "qra"
@@ -69,6 +89,20 @@ def _resolve_template_dir() -> Path:
     return template_dir
 
 
+@lru_cache(maxsize=1)
+def _get_template() -> Template:
+    """
+    Template compilé une fois par process (Environment + parsing/codegen Jinja2 mis en cache).
+    auto_reload=False : pas de stat du fichier template à chaque rendu.
+    """
+    env = Environment(
+        loader=FileSystemLoader(_resolve_template_dir()),
+        autoescape=select_autoescape(["html"]),
+        auto_reload=False,
+    )
+    return env.get_template("report_qra.html")
+
+
 def _compute_ai_enabled() -> bool:
     """
     Détermine si l'IA doit être considérée active pour le rendu.
@@ -85,26 +119,34 @@ def _compute_ai_enabled() -> bool:
 # ============================================================
 # 🔧 API principale
 # ============================================================
-def generate_html_report(qra_result: dict, output_path: Path, *, verbose: bool = False) -> Path:
+def generate_html_report(
+    qra_result: dict,
+    output_path: Path,
+    *,
+    verbose: bool = False,
+    now: Optional[datetime] = None,
+    compress: Optional[str] = None,
+) -> Path:
     """
     Génère le rapport HTML QRA.
 
     Args:
         qra_result: résultat structuré du pipeline QRA
-        output_path: chemin du fichier HTML de sortie
+        output_path: chemin du fichier HTML de sortie (dossier parent créé si besoin)
         verbose: mode verbeux
+        now: horodatage affiché dans le badge (défaut : datetime.now() ; fixé => rendu déterministe)
+        compress: None (HTML brut) ou "gz" (écrit `<output_path>.gz`, gzip niveau 1)
 
     Returns:
-        Path: chemin du fichier HTML généré
-    """
-    template_dir = _resolve_template_dir()
+        Path: chemin du fichier HTML généré (suffixe .gz si compressé)
 
-    env = Environment(
-        loader=FileSystemLoader(template_dir),
-        autoescape=select_autoescape(["html"]),
-    )
+    Raises:
+        ValueError: si `compress` n'est pas supporté
+    """
+    if compress is not None and compress not in _COMPRESS_LEVELS:
+        raise ValueError(f"Unsupported compress={compress!r}. Allowed: {', '.join(_COMPRESS_LEVELS)}")
 
-    template = env.get_template("report_qra.html")
+    template = _get_template()
 
     requirements = qra_result["requirements"]
     global_score = qra_result["global_score"]
@@ -113,20 +155,28 @@ def generate_html_report(qra_result: dict, output_path: Path, *, verbose: bool =
     ai_enabled = _compute_ai_enabled()
     suggestions_label = "IA" if ai_enabled else "RULES"
 
-    html = template.render(
+    stream = template.stream(
         title="Quality Risk Assessment — Rapport",
         header="Quality Risk Assessment — Outil V&V",
         subtitle=f"Mode suggestions : {suggestions_label}",
-        badge=datetime.now().strftime("%Y-%m-%d %H:%M"),
+        badge=(now or datetime.now()).strftime("%Y-%m-%d %H:%M"),
         global_score=global_score,
         global_status=global_status,
         requirements=requirements,
         ai_enabled=ai_enabled,
         suggestions_label=suggestions_label,
     )
+    # regroupe les petits fragments du rendu par paquets (moins d'appels write())
+    stream.enable_buffering(size=64)
 
     output_path.parent.mkdir(parents=True, exist_ok=True)
-    output_path.write_text(html, encoding="utf-8")
+    if compress:
+        output_path = output_path.with_name(f"{output_path.name}.{compress}")
+        with gzip.open(output_path, "wt", encoding="utf-8", compresslevel=_COMPRESS_LEVELS[compress]) as f:
+            stream.dump(f)
+    else:
+        with output_path.open("w", encoding="utf-8", buffering=_WRITE_BUFFER_BYTES) as f:
+            stream.dump(f)
 
     if verbose:
         log.info("[REPORT] HTML generated: %s", output_path)
@@ -140,7 +190,7 @@ def generate_csv_report(qra_result: Dict[str, Any], output_path: Path, *, verbos
 
     Args:
         qra_result: résultat structuré du pipeline QRA
-        output_path: chemin du fichier CSV de sortie
+        output_path: chemin du fichier CSV de sortie (dossier parent créé si besoin)
         verbose: mode verbeux
 
     Returns:
@@ -148,40 +198,27 @@ def generate_csv_report(qra_result: Dict[str, Any], output_path: Path, *, verbos
     """
     rows = qra_result.get("requirements", []) or []
 
-    fieldnames = [
-        "id",
-        "score",
-        "raw_status",
-        "display_status",
-        "text",
-        "issues_count",
-        "suggestions_label",
-        "suggestions_count",
-    ]
-
     ai_enabled = _compute_ai_enabled()
     suggestions_label = "IA" if ai_enabled else "RULES"
 
     output_path.parent.mkdir(parents=True, exist_ok=True)
-    with output_path.open("w", encoding="utf-8", newline="") as f:
-        w = csv.DictWriter(f, fieldnames=fieldnames)
-        w.writeheader()
-        for r in rows:
-            issues = r.get("issues", []) or []
-            sugs = r.get("ai_suggestions", []) or []  # nom historique côté pipeline
-
-            w.writerow(
-                {
-                    "id": r.get("id", ""),
-                    "score": r.get("score", ""),
-                    "raw_status": r.get("raw_status", ""),
-                    "display_status": r.get("display_status", ""),
-                    "text": r.get("text", ""),
-                    "issues_count": len(issues),
-                    "suggestions_label": suggestions_label,
-                    "suggestions_count": len(sugs),
-                }
+    with output_path.open("w", encoding="utf-8", newline="", buffering=_WRITE_BUFFER_BYTES) as f:
+        w = csv.writer(f)
+        w.writerow(_CSV_REPORT_FIELDNAMES)
+        # Tuples dans l'ordre des colonnes : writerows consomme le générateur en une seule boucle C
+        w.writerows(
+            (
+                r.get("id", ""),
+                r.get("score", ""),
+                r.get("raw_status", ""),
+                r.get("display_status", ""),
+                r.get("text", ""),
+                len(r.get("issues", []) or []),
+                suggestions_label,
+                len(r.get("ai_suggestions", []) or []),  # nom historique côté pipeline
             )
+            for r in rows
+        )
 
     if verbose:
         log.info("[REPORT] CSV generated: %s", output_path)
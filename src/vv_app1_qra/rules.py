@@ -24,9 +24,11 @@ from __future__ import annotations
 # 📦 Imports
 # ============================================================
 import logging
+import multiprocessing
 import re
 from dataclasses import dataclass
-from typing import Iterable, List, Sequence, Tuple
+from functools import lru_cache, partial
+from typing import Collection, Dict, FrozenSet, Iterable, Iterator, List, Optional, Sequence, Tuple
 
 from vv_app1_qra.models import (
     AnalysisResult,
@@ -44,11 +46,13 @@ __all__ = [
     "AMBIGUOUS_TERMS",
     "WEAK_MODAL_VERBS",
     "SEVERITY_PENALTY",
+    "PARALLEL_MIN_ROWS",
     "ModuleError",
     "RuleHit",
     "compute_score",
     "analyze_requirement",
     "analyze_requirements",
+    "iter_analyze_requirements",
     "get_logger",
 ]
 
@@ -114,6 +118,12 @@ WEAK_MODAL_VERBS: Tuple[str, ...] = (
     "could",
 )
 
+# Union des deux listes : un seul automate pour le scan fusionné (_scan_ambiguity_terms)
+_SCAN_TERMS: Tuple[str, ...] = WEAK_MODAL_VERBS + AMBIGUOUS_TERMS
+
+# Batch : en dessous de ce volume, le coût de démarrage des processus dépasse le gain
+PARALLEL_MIN_ROWS = 500
+
 SEVERITY_PENALTY = {
     IssueSeverity.INFO: 5,
     IssueSeverity.MINOR: 10,
@@ -122,7 +132,7 @@ SEVERITY_PENALTY = {
 }
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class RuleHit:
     rule_id: str
     category: str
@@ -136,28 +146,83 @@ class RuleHit:
 # ============================================================
 # 🔧 Helpers
 # ============================================================
-def _norm(s: str) -> str:
-    return (s or "").strip()
+_WS_RE = re.compile(r"\s+")
 
 
 def _compact_ws(s: str) -> str:
-    return re.sub(r"\s+", " ", (s or "")).strip()
+    return _WS_RE.sub(" ", s or "").strip()
+
 
+def _term_matcher(terms: Tuple[str, ...]) -> Tuple["re.Pattern[str]", Dict[str, FrozenSet[str]]]:
+    """
+    Compile une liste de termes en UN seul automate regex (une passe sur le texte).
+    Appelé une fois à l'import pour _SCAN_TERMS (scan fusionné, voir _scan_ambiguity_terms).
+
+    - lookahead `(?=(...))` : détecte aussi les occurrences qui se chevauchent
+    - alternatives triées par longueur décroissante : à une position donnée, le plus long gagne ;
+      les termes préfixes de ce dernier sont ajoutés via `implied` (même position)
+    - pas de `\\b` : sémantique sous-chaîne, identique à l'ancien `t.lower() in hay`
+      ("could" est trouvé dans "couldn't") ; équivalence vérifiée terme à terme par les tests
+    """
+    lowered = sorted({t.lower() for t in terms}, key=len, reverse=True)
+    pattern = re.compile("(?=(" + "|".join(re.escape(t) for t in lowered) + "))")
+    implied = {t: frozenset(u for u in lowered if t.startswith(u)) for t in lowered}
+    return pattern, implied
+
+
+# Automate du scan fusionné compilé une seule fois, à l'import
+# (chaque worker du pool l'hérite / le recompile en important le module)
+_SCAN_PATTERN, _SCAN_IMPLIED = _term_matcher(_SCAN_TERMS)
+_scan_finditer = _SCAN_PATTERN.finditer
+# Lettres présentes dans les termes : tout match en contient au moins une (préfiltre exact)
+_SCAN_LETTER_RE = re.compile(
+    "[" + "".join(sorted({re.escape(c) for t in _SCAN_TERMS for c in t.lower() if c.isalpha()})) + "]"
+)
+
+
+def _select_terms(terms: Sequence[str], present: Collection[str]) -> List[str]:
+    """Termes de `terms` présents (minuscules dans `present`), ordre de la liste, dédupliqués."""
+    # dédup stable (dict conserve l'ordre d'insertion)
+    return list(dict.fromkeys(t for t in terms if t.lower() in present))
+
+
+def _scan_ambiguity_terms(
+    text_blob: str, ac: str
+) -> Tuple[List[Tuple[str, int]], List[Tuple[str, int]], List[Tuple[str, int]]]:
+    """
+    Un seul scan de text_blob (titre + texte + AC compactés) pour les deux listes de termes.
 
-def _find_terms(text: str, terms: Sequence[str]) -> List[str]:
-    """Retourne la liste des termes trouvés (dédupliqués) dans text (case-insensitive)."""
-    hay = (text or "").lower()
-    found: List[str] = []
-    for t in terms:
-        if t.lower() in hay:
-            found.append(t)
+    `ac` (AC compactées) est le suffixe de text_blob : les occurrences qui y commencent
+    alimentent aussi la règle AC-002 (comme un scan séparé des seules AC).
+    Chaque terme est accompagné de sa 1re position (index dans text_blob, resp. dans ac) :
+    les règles construisent l'evidence sans re-chercher le terme (_excerpt_at).
 
-    # dédup stable
-    out: List[str] = []
-    for x in found:
-        if x not in out:
-            out.append(x)
-    return out
+    Returns:
+        (modaux faibles du blob, termes ambigus du blob, termes ambigus des AC) — listes de (terme, position)
+    """
+    hay = text_blob.lower()
+    # chaque terme contient au moins une de ses lettres : sans aucune d'elles (vide, chiffres,
+    # ponctuation, symboles), aucun match possible -> pas de scan complet
+    if _SCAN_LETTER_RE.search(hay) is None:
+        return [], [], []
+    ac_start = len(hay) - len(ac.lower()) if ac else len(hay) + 1
+
+    implied = _SCAN_IMPLIED
+    first: Dict[str, int] = {}
+    first_ac: Dict[str, int] = {}
+    for m in _scan_finditer(hay):
+        pos = m.start()
+        for t in implied[m.group(1)]:
+            if t not in first:
+                first[t] = pos
+            if pos >= ac_start and t not in first_ac:
+                first_ac[t] = pos - ac_start
+
+    return (
+        [(t, first[t.lower()]) for t in _select_terms(WEAK_MODAL_VERBS, first)],
+        [(t, first[t.lower()]) for t in _select_terms(AMBIGUOUS_TERMS, first)],
+        [(t, first_ac[t.lower()]) for t in _select_terms(AMBIGUOUS_TERMS, first_ac)],
+    )
 
 
 # Heuristic: detect "units"/threshold hints (optional, conservative)
@@ -185,50 +250,34 @@ def _first_excerpt(text: str, needle: str, *, width: int = 120) -> str:
     idx = low.find(nlow)
     if idx < 0:
         return _compact_ws(src)[:width]
-    start = max(0, idx - width // 3)
-    end = min(len(src), idx + len(needle) + (2 * width // 3))
-    return _compact_ws(src[start:end])
+    return _excerpt_at(src, idx, len(needle), width=width)
 
 
-def _mk_issue(hit: RuleHit) -> Issue:
-    return Issue(
-        rule_id=hit.rule_id,
-        category=hit.category,
-        severity=hit.severity,
-        message=hit.message,
-        field=hit.field,
-        evidence=hit.evidence,
-        recommendation=hit.recommendation,
-    )
+def _excerpt_at(src: str, idx: int, needle_len: int, *, width: int = 120) -> str:
+    """Extrait autour d'une position déjà connue (ex: fournie par le scan de termes)."""
+    start = max(0, idx - width // 3)
+    end = min(len(src), idx + needle_len + (2 * width // 3))
+    return _compact_ws(src[start:end])
 
 
-def _mk_suggestion_from_issue(issue: Issue) -> Suggestion:
-    """Suggestion RULE directement dérivée de l’issue."""
-    rec = _norm(issue.recommendation)
-    if not rec:
-        rec = "Clarifier l’exigence et ajouter des critères d’acceptation mesurables."
-    return Suggestion(
-        source=SuggestionSource.RULE,
-        message=rec,
-        rule_id=issue.rule_id,
-        rationale=_norm(issue.message),
-        confidence=None,
-    )
+_DEFAULT_RULE_RECOMMENDATION = "Clarifier l’exigence et ajouter des critères d’acceptation mesurables."
+_RULE_SOURCE = SuggestionSource.RULE
 
 
 # ============================================================
 # 🧠 Règles (MVP)
 # ============================================================
-def _rule_ambiguity(req: Requirement) -> Iterable[RuleHit]:
-    """Détecte termes ambigus (qualitatifs non mesurables) et modaux faibles."""
-    text_blob = " ".join([req.title, req.text, req.acceptance_criteria])
-    text_blob = _compact_ws(text_blob)
-
+def _rule_ambiguity(
+    text_blob: str, found_weak: Sequence[Tuple[str, int]], found_terms: Sequence[Tuple[str, int]]
+) -> Iterable[RuleHit]:
+    """
+    Détecte termes ambigus (qualitatifs non mesurables) et modaux faibles.
+    `text_blob` = titre + texte + AC compactés ; termes issus de _scan_ambiguity_terms().
+    """
     hits: List[RuleHit] = []
 
-    found_weak = _find_terms(text_blob, WEAK_MODAL_VERBS)
     if found_weak:
-        w = found_weak[0]
+        w, pos = found_weak[0]
         hits.append(
             RuleHit(
                 rule_id="AMB-001",
@@ -236,14 +285,13 @@ def _rule_ambiguity(req: Requirement) -> Iterable[RuleHit]:
                 severity=IssueSeverity.MINOR,
                 message=f"Modal verb '{w}' detected (weak commitment). Prefer 'shall' or measurable phrasing.",
                 field="requirement_text",
-                evidence=_first_excerpt(text_blob, w),
+                evidence=_excerpt_at(text_blob, pos, len(w)),
                 recommendation="Remplacer les modaux faibles (should/may/…) par une formulation normative mesurable (shall + métriques).",
             )
         )
 
-    found_terms = _find_terms(text_blob, AMBIGUOUS_TERMS)
     if found_terms:
-        t = found_terms[0]
+        t, pos = found_terms[0]
         hits.append(
             RuleHit(
                 rule_id="AMB-002",
@@ -251,7 +299,7 @@ def _rule_ambiguity(req: Requirement) -> Iterable[RuleHit]:
                 severity=IssueSeverity.MINOR,
                 message=f"Ambiguous term '{t}' detected (not measurable).",
                 field="requirement_text",
-                evidence=_first_excerpt(text_blob, t),
+                evidence=_excerpt_at(text_blob, pos, len(t)),
                 recommendation="Remplacer les termes qualitatifs par des critères quantifiés (temps, taux, seuils, tolérances).",
             )
         )
@@ -259,12 +307,12 @@ def _rule_ambiguity(req: Requirement) -> Iterable[RuleHit]:
     return hits
 
 
-def _rule_unbounded_scope(req: Requirement) -> Iterable[RuleHit]:
+def _rule_unbounded_scope(req: Requirement, blob: str) -> Iterable[RuleHit]:
     """
     Détecte des formulations de type 'all conditions' / 'any conditions' :
     risque V&V : domaine de validité non borné, souvent non démontrable.
+    `blob` = titre + texte + AC compactés, en minuscules (calculé une fois dans _rule_hits).
     """
-    blob = _compact_ws(" ".join([req.title or "", req.text or "", req.acceptance_criteria or ""])).lower()
     triggers = ("all conditions", "any conditions", "under all conditions", "in any conditions")
 
     if not any(t in blob for t in triggers):
@@ -309,8 +357,9 @@ def _rule_safety_goal(req: Requirement) -> Iterable[RuleHit]:
 
 def _rule_testability(req: Requirement) -> Iterable[RuleHit]:
     """Testabilité : besoin d’un 'verification_method' et/ou 'acceptance_criteria'."""
-    vm = _norm(req.verification_method)
-    ac = _norm(req.acceptance_criteria)
+    # champs déjà trimés à la construction (Requirement.__post_init__) : test de vacuité direct
+    vm = req.verification_method
+    ac = req.acceptance_criteria
 
     if not vm and not ac:
         return [
@@ -341,9 +390,11 @@ def _rule_testability(req: Requirement) -> Iterable[RuleHit]:
     return []
 
 
-def _rule_acceptance_criteria(req: Requirement) -> Iterable[RuleHit]:
-    """Vérifie la qualité des AC : présence, longueur minimale, absence de termes ambigus."""
-    ac = _compact_ws(req.acceptance_criteria)
+def _rule_acceptance_criteria(ac: str, found_terms: Sequence[Tuple[str, int]]) -> Iterable[RuleHit]:
+    """
+    Vérifie la qualité des AC : présence, longueur minimale, absence de termes ambigus.
+    `ac` = AC compactées ; termes ambigus des AC issus de _scan_ambiguity_terms().
+    """
     if not ac:
         return []
 
@@ -358,14 +409,13 @@ def _rule_acceptance_criteria(req: Requirement) -> Iterable[RuleHit]:
                 severity=IssueSeverity.MINOR,
                 message="Acceptance criteria very short; may be insufficiently measurable.",
                 field="acceptance_criteria",
-                evidence=_first_excerpt(ac, ac[: min(len(ac), 10)] if ac else "", width=120),
+                evidence=_excerpt_at(ac, 0, min(len(ac), 10)),
                 recommendation="Étoffer les critères d’acceptation : métriques, seuils, tolérances, Given/When/Then.",
             )
         )
 
-    found_terms = _find_terms(ac, AMBIGUOUS_TERMS)
     if found_terms:
-        t = found_terms[0]
+        t, pos = found_terms[0]
         hits.append(
             RuleHit(
                 rule_id="AC-002",
@@ -373,7 +423,7 @@ def _rule_acceptance_criteria(req: Requirement) -> Iterable[RuleHit]:
                 severity=IssueSeverity.INFO,
                 message=f"Ambiguous term '{t}' in acceptance criteria.",
                 field="acceptance_criteria",
-                evidence=_first_excerpt(ac, t),
+                evidence=_excerpt_at(ac, pos, len(t)),
                 recommendation="Rendre les critères d’acceptation mesurables (chiffres, seuils, tolérances, délais).",
             )
         )
@@ -387,7 +437,7 @@ def _rule_acceptance_criteria(req: Requirement) -> Iterable[RuleHit]:
                 severity=IssueSeverity.INFO,
                 message="No numeric/threshold hint detected in acceptance criteria (consider quantifying).",
                 field="acceptance_criteria",
-                evidence=_first_excerpt(ac, ac[: min(len(ac), 12)] if ac else "", width=120),
+                evidence=_excerpt_at(ac, 0, min(len(ac), 12)),
                 recommendation="Ajouter au moins une valeur/borne (temps, taux, seuil, tolérance) pour rendre l’AC vérifiable.",
             )
         )
@@ -395,6 +445,34 @@ def _rule_acceptance_criteria(req: Requirement) -> Iterable[RuleHit]:
     return hits
 
 
+@lru_cache(maxsize=4096)
+def _rule_hits(title: str, text: str, acceptance_criteria: str, verification_method: str) -> Tuple[RuleHit, ...]:
+    """
+    Applique toutes les règles, mémoïsé sur les seuls champs lus par les règles
+    (exigences dupliquées / boilerplate : scans regex faits une seule fois).
+    RuleHit est immuable : le tuple retourné peut être partagé sans risque.
+    """
+    req = Requirement(
+        req_id="-",  # non lu par les règles (hors clé de cache)
+        title=title,
+        text=text,
+        acceptance_criteria=acceptance_criteria,
+        verification_method=verification_method,
+    )
+    text_blob = _compact_ws(" ".join([req.title, req.text, req.acceptance_criteria]))
+    ac = _compact_ws(req.acceptance_criteria)
+    found_weak, found_terms, found_ac_terms = _scan_ambiguity_terms(text_blob, ac)
+
+    # Ordre d'évaluation = ordre des issues dans le résultat
+    hits: List[RuleHit] = []
+    hits.extend(_rule_ambiguity(text_blob, found_weak, found_terms))
+    hits.extend(_rule_unbounded_scope(req, text_blob.lower()))
+    hits.extend(_rule_safety_goal(req))
+    hits.extend(_rule_testability(req))
+    hits.extend(_rule_acceptance_criteria(ac, found_ac_terms))
+    return tuple(hits)
+
+
 # ============================================================
 # 🧮 Scoring + Orchestration
 # ============================================================
@@ -403,9 +481,8 @@ def compute_score(issues: Sequence[Issue], base: int = 100) -> int:
     Score simple :
       100 - somme(pénalités par sévérité), clamp [0..100]
     """
-    score = int(base)
-    for i in issues:
-        score -= int(SEVERITY_PENALTY.get(i.severity, 0))
+    penalty = SEVERITY_PENALTY.get
+    score = int(base) - sum(penalty(i.severity, 0) for i in issues)
     return max(0, min(100, score))
 
 
@@ -420,18 +497,29 @@ def analyze_requirement(req: Requirement, *, verbose: bool = False) -> AnalysisR
         if not isinstance(req, Requirement):
             raise ModuleError("Invalid input: 'req' must be a Requirement.")
 
-        if verbose:
+        # setLevel() invalide le cache de niveaux de tous les loggers : une seule fois, pas par exigence
+        if verbose and log.level != logging.DEBUG:
             log.setLevel(logging.DEBUG)
 
-        hits: List[RuleHit] = []
-        hits.extend(list(_rule_ambiguity(req)))
-        hits.extend(list(_rule_unbounded_scope(req)))
-        hits.extend(list(_rule_safety_goal(req)))
-        hits.extend(list(_rule_testability(req)))
-        hits.extend(list(_rule_acceptance_criteria(req)))
-
-        issues = [_mk_issue(h) for h in hits]
-        suggestions = [_mk_suggestion_from_issue(i) for i in issues]
+        hits = _rule_hits(req.title, req.text, req.acceptance_criteria, req.verification_method)
+
+        # Une passe : Issue + Suggestion RULE dérivée (arguments positionnels, ordre des champs).
+        # Les champs de l'Issue sont déjà normalisés (Issue.__post_init__) : pas de re-trim.
+        issues: List[Issue] = []
+        suggestions: List[Suggestion] = []
+        add_issue = issues.append
+        add_suggestion = suggestions.append
+        for h in hits:
+            issue = Issue(h.rule_id, h.category, h.severity, h.message, h.field, h.evidence, h.recommendation)
+            add_issue(issue)
+            add_suggestion(
+                Suggestion(
+                    _RULE_SOURCE,
+                    issue.recommendation or _DEFAULT_RULE_RECOMMENDATION,
+                    issue.rule_id,
+                    issue.message,
+                )
+            )
 
         score = compute_score(issues)
         return AnalysisResult(
@@ -449,6 +537,36 @@ def analyze_requirement(req: Requirement, *, verbose: bool = False) -> AnalysisR
         raise ModuleError(str(e)) from e
 
 
-def analyze_requirements(reqs: Sequence[Requirement], *, verbose: bool = False) -> List[AnalysisResult]:
-    """Analyse batch (liste d’exigences)."""
-    return [analyze_requirement(r, verbose=verbose) for r in reqs]
+def iter_analyze_requirements(reqs: Iterable[Requirement], *, verbose: bool = False) -> Iterator[AnalysisResult]:
+    """
+    Analyse séquentielle paresseuse : un AnalysisResult à la fois (ordre d’entrée conservé).
+    Pour un consommateur en flux (écriture ligne à ligne) : mémoire O(1) au lieu de O(N).
+    """
+    for r in reqs:
+        yield analyze_requirement(r, verbose=verbose)
+
+
+def analyze_requirements(
+    reqs: Iterable[Requirement],
+    *,
+    verbose: bool = False,
+    workers: Optional[int] = None,
+    min_parallel: int = PARALLEL_MIN_ROWS,
+) -> List[AnalysisResult]:
+    """
+    Analyse batch (ordre d’entrée conservé).
+
+    - workers None/<= 1 : séquentiel, streaming depuis l'itérable
+    - workers > 1       : multiprocessing.Pool (CPU-bound, pas de dépendance entre exigences),
+                          seulement si le volume atteint `min_parallel`
+    """
+    if not workers or workers <= 1:
+        return list(iter_analyze_requirements(reqs, verbose=verbose))
+
+    items = list(reqs)
+    if len(items) < max(2, min_parallel):
+        return [analyze_requirement(r, verbose=verbose) for r in items]
+
+    chunksize = max(1, len(items) // (workers * 4))
+    with multiprocessing.Pool(processes=workers) as pool:
+        return pool.map(partial(analyze_requirement, verbose=verbose), items, chunksize=chunksize)
@@ -0,0 +1,44 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+============================================================
+tests.conftest
+------------------------------------------------------------
+Description :
+    Fixtures partagées pytest — APP1 QRA.
+
+Objectifs :
+    - IA désactivée par défaut pour toute la session (ENABLE_AI=0, sans clé) :
+      les tests IA la réactivent localement via monkeypatch
+    - Isoler chaque test des caches process (lecture env IA mémoïsée, client OpenAI partagé)
+============================================================
+"""
+
+from __future__ import annotations
+
+import pytest
+
+from vv_app1_qra import ia_assistant
+
+
+def _clear() -> None:
+    ia_assistant.is_ai_enabled.cache_clear()
+    ia_assistant._get_model.cache_clear()
+    ia_assistant._reset_client()
+
+
+@pytest.fixture(autouse=True, scope="session")
+def _ai_disabled_env():
+    """Environnement IA neutre appliqué une fois par session (restauré en fin de session)."""
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setenv("ENABLE_AI", "0")
+        mp.delenv("OPENAI_API_KEY", raising=False)
+        yield
+
+
+@pytest.fixture(autouse=True)
+def _reset_process_caches():
+    """Vide les caches process avant/après chaque test (monkeypatch env / SDK factice)."""
+    _clear()
+    yield
+    _clear()
@@ -11,6 +11,10 @@ Objectifs :
     - ENABLE_AI absent/0 => IA désactivée
     - ENABLE_AI=1 sans clé => fallback [] (non bloquant)
     - ENABLE_AI=1 avec clé => is_ai_enabled True
+    - Batch : un appel API par tranche, résultats ré-associés par position (item, req_id vérifié)
+    - Cache disque : exigence inchangée => pas de second appel API
+    - Dédup intra-run : contenu identique => un seul envoi
+    - req_id dupliqués dans une tranche : ré-association par position (item)
 
 Usage :
     pytest -q
@@ -19,10 +23,35 @@ Usage :
 
 from __future__ import annotations
 
-from vv_app1_qra.ia_assistant import is_ai_enabled, suggest_improvements
+import sys
+import types
+from pathlib import Path
+
+import pytest
+
+from vv_app1_qra import ia_assistant
+from vv_app1_qra.ia_assistant import is_ai_enabled, suggest_improvements, suggest_improvements_batch
 from vv_app1_qra.models import Issue, IssueSeverity, Requirement
 
 
+# ============================================================
+# 🔧 Fixtures
+# ============================================================
+@pytest.fixture
+def fake_openai(monkeypatch, tmp_path: Path):
+    """
+    IA activée avec un SDK factice (aucun appel réseau) et un cache disque isolé.
+    """
+    monkeypatch.setenv("ENABLE_AI", "1")
+    monkeypatch.setenv("OPENAI_API_KEY", "sk-test")
+    monkeypatch.setenv("QRA_AI_CACHE_PATH", str(tmp_path / "ai.sqlite"))
+    monkeypatch.setitem(sys.modules, "openai", types.SimpleNamespace(OpenAI=lambda: object()))
+    return monkeypatch
+
+
+# ============================================================
+# 🧪 Tests
+# ============================================================
 def test_is_ai_enabled_false_by_default(monkeypatch):
     monkeypatch.delenv("ENABLE_AI", raising=False)
     monkeypatch.delenv("OPENAI_API_KEY", raising=False)
@@ -62,4 +91,268 @@ def test_is_ai_enabled_requires_key(monkeypatch):
     assert is_ai_enabled() is False
 
     monkeypatch.setenv("OPENAI_API_KEY", "sk-test")
+    assert is_ai_enabled() is False  # lu une fois par process
+
+    is_ai_enabled.cache_clear()
     assert is_ai_enabled() is True
+
+
+def test_suggest_improvements_batch_disabled_returns_aligned_empty_lists(monkeypatch):
+    monkeypatch.setenv("ENABLE_AI", "0")
+    monkeypatch.delenv("OPENAI_API_KEY", raising=False)
+
+    items = [
+        (Requirement(req_id="REQ-1", title="t", text="The system should be fast."), []),
+        (Requirement(req_id="REQ-2", title="t", text="The UI shall be intuitive."), []),
+    ]
+    out = suggest_improvements_batch(items)
+    assert out == [[], []]
+
+
+def test_suggest_improvements_batch_without_item_falls_back_to_unique_req_id(fake_openai):
+    """
+    Un seul appel API pour plusieurs exigences ; entrées sans `item` ré-associées
+    par req_id (unique dans la tranche).
+    """
+    calls = []
+
+    def fake_create(client, model, prompt, **kwargs):
+        calls.append(prompt)
+        return (
+            '{"results": ['
+            '{"req_id": "REQ-2", "suggestions": [{"message": "Use shall + 200 ms", "confidence": 0.7}]},'
+            '{"req_id": "REQ-1", "suggestions": [{"message": "Define latency <= 100 ms"}]}'
+            "]}"
+        )
+
+    fake_openai.setattr(ia_assistant, "_responses_create", fake_create)
+
+    items = [
+        (Requirement(req_id="REQ-1", title="t", text="The system should be fast."), []),
+        (Requirement(req_id="REQ-2", title="t", text="The UI should be quick."), []),
+        (Requirement(req_id="REQ-3", title="t", text="The HMI should be clear."), []),
+    ]
+    out = suggest_improvements_batch(items, batch_size=10)
+
+    assert len(calls) == 1
+    assert [s.message for s in out[0]] == ["Define latency <= 100 ms"]
+    assert [s.message for s in out[1]] == ["Use shall + 200 ms"]
+    assert out[1][0].confidence == 0.7
+    assert out[2] == []
+
+
+def test_suggest_improvements_batch_parallel_chunks_keep_order(fake_openai):
+    fake_openai.setenv("QRA_AI_WORKERS", "4")
+
+    def fake_create(client, model, prompt, **kwargs):
+        rid = prompt.split("req_id: ", 1)[1].split("\n", 1)[0]
+        return f'{{"results": [{{"req_id": "{rid}", "suggestions": [{{"message": "fix {rid}"}}]}}]}}'
+
+    fake_openai.setattr(ia_assistant, "_responses_create", fake_create)
+
+    items = [
+        (Requirement(req_id=f"REQ-{n}", title="t", text=f"The system should be fast ({n})."), [])
+        for n in range(6)
+    ]
+    out = suggest_improvements_batch(items, batch_size=1)
+
+    assert [s[0].message for s in out] == [f"fix REQ-{n}" for n in range(6)]
+
+
+def test_suggest_improvements_cache_hit_skips_api_call(fake_openai):
+    calls = []
+
+    def fake_create(client, model, prompt, **kwargs):
+        calls.append(prompt)
+        return '{"results": [{"req_id": "REQ-1", "suggestions": [{"message": "Define latency <= 100 ms"}]}]}'
+
+    fake_openai.setattr(ia_assistant, "_responses_create", fake_create)
+
+    req = Requirement(req_id="REQ-1", title="t", text="The system should be fast.")
+    first = suggest_improvements(req, [])
+    second = suggest_improvements(req, [])
+
+    assert len(calls) == 1
+    assert [s.message for s in second] == [s.message for s in first] == ["Define latency <= 100 ms"]
+
+
+def test_suggest_improvements_batch_dedups_identical_content(fake_openai):
+    prompts = []
+
+    def fake_create(client, model, prompt, **kwargs):
+        prompts.append(prompt)
+        return '{"results": [{"req_id": "REQ-1", "suggestions": [{"message": "Define latency <= 100 ms"}]}]}'
+
+    fake_openai.setattr(ia_assistant, "_responses_create", fake_create)
+
+    items = [
+        (Requirement(req_id="REQ-1", title="t", text="The system should be fast."), []),
+        (Requirement(req_id="REQ-2", title="t", text="The system should be fast."), []),
+    ]
+    out = suggest_improvements_batch(items)
+
+    assert len(prompts) == 1
+    assert "REQ-2" not in prompts[0]
+    assert [s.message for s in out[0]] == [s.message for s in out[1]] == ["Define latency <= 100 ms"]
+
+
+def test_suggest_improvements_batch_cache_is_per_requirement(fake_openai):
+    prompts = []
+
+    def fake_create(client, model, prompt, **kwargs):
+        prompts.append(prompt)
+        results = [
+            f'{{"req_id": "{rid}", "suggestions": [{{"message": "fix {rid}"}}]}}'
+            for rid in ("REQ-1", "REQ-2")
+            if f"req_id: {rid}" in prompt
+        ]
+        return '{"results": [' + ", ".join(results) + "]}"
+
+    fake_openai.setattr(ia_assistant, "_responses_create", fake_create)
+
+    r1 = Requirement(req_id="REQ-1", title="t", text="The system should be fast.")
+    r2 = Requirement(req_id="REQ-2", title="t", text="The UI should be robust.")
+    suggest_improvements_batch([(r1, []), (r2, [])])
+
+    r2_changed = Requirement(req_id="REQ-2", title="t", text="The UI shall recover within 2 s.")
+    out = suggest_improvements_batch([(r1, []), (r2_changed, [])])
+
+    assert len(prompts) == 2
+    assert "REQ-1" not in prompts[1]
+    assert [s[0].message for s in out] == ["fix REQ-1", "fix REQ-2"]
+
+    suggest_improvements_batch([(r1, []), (r2_changed, [])], use_cache=False)
+    assert len(prompts) == 3
+
+
+def test_suggest_improvements_batch_duplicate_req_ids_map_by_position(fake_openai):
+    """
+    Même req_id, contenus différents, même tranche : réponses ré-associées par `item`,
+    jamais partagées via le req_id (ni en sortie, ni dans le cache).
+    """
+    prompts = []
+
+    def fake_create(client, model, prompt, **kwargs):
+        prompts.append(prompt)
+        return (
+            '{"results": ['
+            '{"item": 2, "req_id": "REQ-1", "suggestions": [{"message": "fix UI"}]},'
+            '{"item": 1, "req_id": "REQ-1", "suggestions": [{"message": "fix latency"}]}'
+            "]}"
+        )
+
+    fake_openai.setattr(ia_assistant, "_responses_create", fake_create)
+
+    a = Requirement(req_id="REQ-1", title="t", text="The system should be fast.")
+    b = Requirement(req_id="REQ-1", title="t", text="The UI should be intuitive.")
+    out = suggest_improvements_batch([(a, []), (b, [])], batch_size=10)
+
+    assert "item: 1\nreq_id: REQ-1" in prompts[0] and "item: 2\nreq_id: REQ-1" in prompts[0]
+    assert [s[0].message for s in out] == ["fix latency", "fix UI"]
+
+    # cache par contenu : chaque exigence retrouve ses propres suggestions
+    assert [s.message for s in suggest_improvements(b, [])] == ["fix UI"]
+    assert len(prompts) == 1
+
+
+def test_suggest_improvements_batch_duplicate_req_ids_without_item_are_dropped(fake_openai):
+    def fake_create(client, model, prompt, **kwargs):
+        return '{"results": [{"req_id": "REQ-1", "suggestions": [{"message": "ambiguous"}]}]}'
+
+    fake_openai.setattr(ia_assistant, "_responses_create", fake_create)
+
+    a = Requirement(req_id="REQ-1", title="t", text="The system should be fast.")
+    b = Requirement(req_id="REQ-1", title="t", text="The UI should be intuitive.")
+    assert suggest_improvements_batch([(a, []), (b, [])], batch_size=10) == [[], []]
+
+
+def test_suggest_improvements_batch_rejects_shifted_item_numbers(fake_openai):
+    """
+    `item` décalé (0-based) : le req_id renvoyé ne correspond pas à la position => entrée rejetée
+    pour cette position ; repli sur req_id unique, sinon suggestions vides et rien en cache.
+    """
+    prompts = []
+
+    def fake_create(client, model, prompt, **kwargs):
+        prompts.append(prompt)
+        return (
+            '{"results": ['
+            '{"item": 0, "req_id": "REQ-1", "suggestions": [{"message": "fix REQ-1"}]},'
+            '{"item": 1, "req_id": "REQ-2", "suggestions": [{"message": "fix REQ-2"}]},'
+            '{"item": 3, "req_id": "REQ-9", "suggestions": [{"message": "fix REQ-9"}]}'
+            "]}"
+        )
+
+    fake_openai.setattr(ia_assistant, "_responses_create", fake_create)
+
+    r1 = Requirement(req_id="REQ-1", title="t", text="The system should be fast.")
+    r2 = Requirement(req_id="REQ-2", title="t", text="The UI should be intuitive.")
+    r3 = Requirement(req_id="REQ-3", title="t", text="The HMI should be clear.")
+    out = suggest_improvements_batch([(r1, []), (r2, []), (r3, [])], batch_size=10)
+
+    # REQ-1 / REQ-2 : item décalé rejeté, repli req_id ; REQ-3 : req_id renvoyé incohérent => rien
+    assert [[s.message for s in x] for x in out] == [["fix REQ-1"], ["fix REQ-2"], []]
+
+    # cache : REQ-2 garde ses propres suggestions ; REQ-3 (rejeté) n'a pas été mis en cache
+    assert [s.message for s in suggest_improvements(r2, [])] == ["fix REQ-2"]
+    assert len(prompts) == 1
+    suggest_improvements(r3, [])
+    assert len(prompts) == 2
+
+
+def test_suggest_improvements_batch_shifted_items_with_duplicate_req_ids_are_dropped(fake_openai):
+    def fake_create(client, model, prompt, **kwargs):
+        return (
+            '{"results": ['
+            '{"item": 0, "req_id": "REQ-1", "suggestions": [{"message": "first"}]},'
+            '{"item": 1, "req_id": "REQ-X", "suggestions": [{"message": "second"}]}'
+            "]}"
+        )
+
+    fake_openai.setattr(ia_assistant, "_responses_create", fake_create)
+
+    a = Requirement(req_id="REQ-1", title="t", text="The system should be fast.")
+    b = Requirement(req_id="REQ-1", title="t", text="The UI should be intuitive.")
+    assert suggest_improvements_batch([(a, []), (b, [])], batch_size=10) == [[], []]
+
+
+def test_truncated_output_retries_chunk_in_halves(fake_openai):
+    """
+    JSON tronqué (budget de tokens épuisé) sur une tranche de 4 : rejoué en moitiés,
+    chaque exigence récupère ses suggestions au lieu d'être perdue.
+    """
+    sizes = []
+
+    def fake_create(client, model, prompt, **kwargs):
+        rids = [line.split(": ", 1)[1] for line in prompt.splitlines() if line.startswith("req_id: ")]
+        sizes.append(len(rids))
+        if len(rids) > 2:
+            return '{"results": [{"item": 1, "req_id": "REQ-0", "sugg'
+        entries = [
+            f'{{"item": {n}, "req_id": "{rid}", "suggestions": [{{"message": "fix {rid}"}}]}}'
+            for n, rid in enumerate(rids, 1)
+        ]
+        return '{"results": [' + ", ".join(entries) + "]}"
+
+    fake_openai.setattr(ia_assistant, "_responses_create", fake_create)
+
+    items = [
+        (Requirement(req_id=f"REQ-{n}", title="t", text=f"The system should be fast ({n})."), [])
+        for n in range(4)
+    ]
+    out = suggest_improvements_batch(items, batch_size=10)
+
+    assert sizes == [4, 2, 2]
+    assert [s[0].message for s in out] == [f"fix REQ-{n}" for n in range(4)]
+
+
+def test_responses_create_rejects_incomplete_status():
+    resp = types.SimpleNamespace(
+        status="incomplete",
+        incomplete_details=types.SimpleNamespace(reason="max_output_tokens"),
+        output_text='{"results": [',
+    )
+    client = types.SimpleNamespace(responses=types.SimpleNamespace(create=lambda **kwargs: resp))
+
+    with pytest.raises(ia_assistant.ModuleError, match="max_output_tokens"):
+        ia_assistant._responses_create(client, "m", "prompt", max_output_tokens=10)
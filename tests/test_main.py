@@ -12,6 +12,8 @@ Objectifs :
     - Vérifier validation des entrées
     - Vérifier fallback IA (ENABLE_AI=1 sans clé)
     - Vérifier génération report stable (html+csv)
+    - Vérifier mapping des en-têtes CSV legacy (alias)
+    - Vérifier --jobs (multiprocessing) équivalent au séquentiel
 
 Usage :
     pytest -q
@@ -25,7 +27,17 @@ from pathlib import Path
 
 import pytest
 
-from vv_app1_qra.main import ModuleError, process
+from vv_app1_qra.main import (
+    ModuleError,
+    _analyze_all,
+    iter_requirements_csv,
+    load_requirements_csv,
+    process,
+    write_output_csv,
+    write_output_html,
+)
+from vv_app1_qra.models import Requirement
+from vv_app1_qra.rules import analyze_requirement
 
 
 # ============================================================
@@ -186,3 +198,58 @@ def test_main_ai_enabled_without_key_fallback(tmp_path: Path, monkeypatch):
     html = report_html.read_text(encoding="utf-8")
     assert "Mode suggestions" in html
     assert "RULES" in html
+
+
+def test_load_requirements_csv_legacy_headers(tmp_path: Path):
+    """
+    En-têtes legacy (casse/espaces, alias) + fallback alias par ligne + ligne vide ignorée.
+    """
+    p = tmp_path / "legacy.csv"
+    p.write_text(
+        " ID ,Summary,Description,Requirement_Text,AC\n"
+        "L-1,Login,The system shall log in users.,,Login <= 2 s\n"
+        "\n"
+        ",,,The UI should be fast.,\n",
+        encoding="utf-8",
+    )
+
+    rows = load_requirements_csv(p)
+
+    assert [r["req_id"] for r in rows] == ["L-1", "REQ-002"]
+    assert rows[0]["title"] == "Login"
+    assert rows[0]["text"] == "The system shall log in users."
+    assert rows[0]["acceptance_criteria"] == "Login <= 2 s"
+    assert rows[0]["source"] == "demo"
+    assert rows[1]["text"] == "The UI should be fast."
+
+
+def test_analyze_all_parallel_matches_sequential():
+    """
+    --jobs > 1 : même résultat (et même ordre) que le chemin séquentiel.
+    """
+    reqs = list(iter_requirements_csv(Path("data/inputs/demo_input.csv")))
+
+    sequential = _analyze_all(reqs, jobs=1)
+    parallel = _analyze_all(reqs, jobs=2, min_parallel=0)
+
+    assert [a.to_dict() for a in parallel] == [a.to_dict() for a in sequential]
+
+
+def test_iter_requirements_csv_matches_row_dicts():
+    """
+    Mapping positionnel (tuple -> Requirement) : identique au mapping par dict.
+    """
+    p = Path("data/inputs/demo_input.csv")
+
+    expected = [Requirement.from_dict(r) for r in load_requirements_csv(p)]
+    assert list(iter_requirements_csv(p)) == expected
+
+
+def test_legacy_writers_create_missing_parent_directory(tmp_path: Path):
+    analyses = [analyze_requirement(Requirement(req_id="REQ-1", title="t", text="The UI should be fast."))]
+
+    write_output_csv(tmp_path / "missing" / "a" / "out.csv", analyses)
+    write_output_html(tmp_path / "missing" / "b" / "out.html", analyses)
+
+    assert (tmp_path / "missing" / "a" / "out.csv").exists()
+    assert (tmp_path / "missing" / "b" / "out.html").exists()
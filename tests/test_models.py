@@ -35,8 +35,9 @@ from vv_app1_qra.models import (
 # ============================================================
 # 🔧 Fixtures
 # ============================================================
-@pytest.fixture
+@pytest.fixture(scope="module")
 def sample_requirement() -> Requirement:
+    """Exigence immuable (frozen) : partagée par les tests du module."""
     return Requirement(
         req_id="REQ-001",
         title="Train Control / Brake / High",
@@ -102,6 +103,21 @@ def test_issue_from_dict_accepts_enum_value():
     assert i.severity == IssueSeverity.CRITICAL
 
 
+def test_issue_from_dict_shares_rule_metadata_strings():
+    a = Issue.from_dict({"rule_id": "".join(["AMB", "-001"]), "category": "AMBIGUITY", "severity": "MINOR", "message": "m"})
+    b = Issue.from_dict({"rule_id": "".join(["AMB-", "001"]), "category": "AMBIGUITY", "severity": "MINOR", "message": "m"})
+    assert a.rule_id is b.rule_id
+    assert a.category is b.category
+
+
+def test_issue_from_dict_shares_padded_rule_metadata_strings():
+    a = Issue.from_dict({"rule_id": " AMB-001 ", "category": "AMBIGUITY\n", "severity": "MINOR", "message": "m"})
+    b = Issue.from_dict({"rule_id": "AMB-001", "category": " AMBIGUITY", "severity": "MINOR", "message": "m"})
+    assert a.rule_id == "AMB-001"
+    assert a.rule_id is b.rule_id
+    assert a.category is b.category
+
+
 def test_issue_from_dict_rejects_unknown_severity():
     d = {
         "rule_id": "R-TST-001",
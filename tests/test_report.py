@@ -14,58 +14,52 @@ Objectifs :
 
 Usage :
     pytest -q
+    pytest -q -m "not slow"   # boucle rapide : sans les tests I/O rapport (marqueur slow)
 ============================================================
 """
 
 from __future__ import annotations
 
 import csv
-import re
+import gzip
+from datetime import datetime
 from pathlib import Path
 
+import pytest
+
 from vv_app1_qra.report import generate_csv_report, generate_html_report
 
 
 # ============================================================
-# 🔧 Helpers
+# 🧾 Données (lues seulement par les générateurs : partagées, sans copie)
 # ============================================================
-def _normalize_report_html(html: str) -> str:
-    # Supprime le timestamp "YYYY-MM-DD HH:MM" dans le badge
-    return re.sub(r"\d{4}-\d{2}-\d{2}\s+\d{2}:\d{2}", "<TS>", html)
+QRA_SAMPLE = {
+    "global_score": 90.0,
+    "global_status": "À risque",
+    "requirements": [
+        {"id": "REQ-001", "score": 100, "display_status": "OK", "raw_status": "CHECKED", "text": "t1", "issues": [], "ai_suggestions": []},
+        {"id": "REQ-002", "score": 70, "display_status": "À risque", "raw_status": "CHECKED", "text": "t2", "issues": [{"severity": "MAJOR", "message": "m"}], "ai_suggestions": ["s1"]},
+    ],
+}
+
+
+# ============================================================
+# 🔧 Fixtures
+# ============================================================
+@pytest.fixture(scope="module")
+def reports_dir(tmp_path_factory) -> Path:
+    """Répertoire de sortie partagé par le module (un nom de fichier distinct par test)."""
+    return tmp_path_factory.mktemp("reports")
 
 
 # ============================================================
 # 🧪 Tests
 # ============================================================
-def test_generate_html_report_creates_valid_html(tmp_path: Path):
-    output_path = tmp_path / "qra_report.html"
-
-    qra_result = {
-        "global_score": 85,
-        "global_status": "À risque",
-        "requirements": [
-            {
-                "id": "REQ-001",
-                "text": "The system shall respond within 200 ms.",
-                "score": 100,
-                "raw_status": "CHECKED",
-                "display_status": "OK",
-                "issues": [],
-                "ai_suggestions": [],
-            },
-            {
-                "id": "REQ-002",
-                "text": "The UI should be fast.",
-                "score": 70,
-                "raw_status": "CHECKED",
-                "display_status": "À risque",
-                "issues": [{"severity": "MINOR", "message": "Weak modal detected"}],
-                "ai_suggestions": ["Use shall with measurable criteria"],
-            },
-        ],
-    }
-
-    result_path = generate_html_report(qra_result=qra_result, output_path=output_path, verbose=False)
+@pytest.mark.slow
+def test_generate_html_report_creates_valid_html(reports_dir: Path):
+    output_path = reports_dir / "qra_report.html"
+
+    result_path = generate_html_report(qra_result=QRA_SAMPLE, output_path=output_path, verbose=False)
 
     assert result_path.exists()
     content = result_path.read_text(encoding="utf-8")
@@ -78,49 +72,64 @@ def test_generate_html_report_creates_valid_html(tmp_path: Path):
     assert "À risque" in content
 
 
-def test_report_is_deterministic_except_timestamp(tmp_path: Path, monkeypatch):
-    monkeypatch.setenv("ENABLE_AI", "0")
-    monkeypatch.delenv("OPENAI_API_KEY", raising=False)
+@pytest.mark.slow
+def test_report_is_deterministic_except_timestamp(reports_dir: Path):
+    p1 = reports_dir / "r1.html"
+    p2 = reports_dir / "r2.html"
+
+    # horodatage fixé : comparaison octet à octet, sans nettoyage du timestamp
+    now = datetime(2024, 1, 1, 0, 0)
+    generate_html_report(QRA_SAMPLE, p1, verbose=False, now=now)
+    generate_html_report(QRA_SAMPLE, p2, verbose=False, now=now)
 
-    qra_result = {
-        "global_score": 90.0,
-        "global_status": "À risque",
-        "requirements": [
-            {"id": "REQ-001", "score": 100, "display_status": "OK", "raw_status": "CHECKED", "text": "t1", "issues": [], "ai_suggestions": []},
-            {"id": "REQ-002", "score": 70, "display_status": "À risque", "raw_status": "CHECKED", "text": "t2", "issues": [{"severity": "MAJOR", "message": "m"}], "ai_suggestions": ["s1"]},
-        ],
-    }
+    assert p1.read_bytes() == p2.read_bytes()
+    assert "2024-01-01 00:00" in p1.read_text(encoding="utf-8")
 
-    p1 = tmp_path / "r1.html"
-    p2 = tmp_path / "r2.html"
 
-    generate_html_report(qra_result, p1, verbose=False)
-    generate_html_report(qra_result, p2, verbose=False)
+@pytest.mark.slow
+def test_csv_report_contains_expected_ids_and_scores(reports_dir: Path):
+    out = reports_dir / "qra_report.csv"
+    generate_csv_report(QRA_SAMPLE, out, verbose=False)
 
-    h1 = _normalize_report_html(p1.read_text(encoding="utf-8"))
-    h2 = _normalize_report_html(p2.read_text(encoding="utf-8"))
+    with out.open("r", encoding="utf-8", newline="") as f:
+        reader = csv.reader(f)
+        header = next(reader)
+        id_i, score_i = header.index("id"), header.index("score")
+        rows = [(row[id_i], row[score_i]) for row in reader]
 
-    assert h1 == h2
+    assert [r[0] for r in rows] == ["REQ-001", "REQ-002"]
+    assert [r[1] for r in rows] == ["100", "70"]
 
 
-def test_csv_report_contains_expected_ids_and_scores(tmp_path: Path, monkeypatch):
-    monkeypatch.setenv("ENABLE_AI", "0")
-    monkeypatch.delenv("OPENAI_API_KEY", raising=False)
+@pytest.mark.slow
+def test_generate_html_report_gzip_matches_plain_render(reports_dir: Path):
+    now = datetime(2024, 1, 1, 0, 0)
+    plain = generate_html_report(QRA_SAMPLE, reports_dir / "plain.html", now=now)
+    packed = generate_html_report(QRA_SAMPLE, reports_dir / "packed.html", now=now, compress="gz")
 
-    qra_result = {
-        "global_score": 90.0,
-        "global_status": "À risque",
-        "requirements": [
-            {"id": "REQ-001", "score": 100, "display_status": "OK", "raw_status": "CHECKED", "text": "t1", "issues": [], "ai_suggestions": []},
-            {"id": "REQ-002", "score": 70, "display_status": "À risque", "raw_status": "CHECKED", "text": "t2", "issues": [{"severity": "MAJOR", "message": "m"}], "ai_suggestions": ["s1"]},
-        ],
-    }
+    assert packed.name == "packed.html.gz"
+    assert gzip.decompress(packed.read_bytes()) == plain.read_bytes()
 
-    out = tmp_path / "qra_report.csv"
-    generate_csv_report(qra_result, out, verbose=False)
+    with pytest.raises(ValueError):
+        generate_html_report(QRA_SAMPLE, reports_dir / "x.html", compress="zip")
 
-    with out.open("r", encoding="utf-8", newline="") as f:
-        rows = list(csv.DictReader(f))
 
-    assert [r["id"] for r in rows] == ["REQ-001", "REQ-002"]
-    assert [r["score"] for r in rows] == ["100", "70"]
+@pytest.mark.slow
+def test_reports_create_missing_parent_directory(reports_dir: Path):
+    html = generate_html_report(QRA_SAMPLE, reports_dir / "missing" / "a" / "r.html")
+    csv_out = generate_csv_report(QRA_SAMPLE, reports_dir / "missing" / "b" / "r.csv")
+
+    assert html.exists()
+    assert csv_out.exists()
+
+
+@pytest.mark.slow
+def test_report_ai_label_follows_environment_between_runs(reports_dir: Path, monkeypatch):
+    off = generate_html_report(QRA_SAMPLE, reports_dir / "label_off.html").read_text(encoding="utf-8")
+
+    monkeypatch.setenv("ENABLE_AI", "1")
+    monkeypatch.setenv("OPENAI_API_KEY", "sk-test")
+    on = generate_html_report(QRA_SAMPLE, reports_dir / "label_on.html").read_text(encoding="utf-8")
+
+    assert "Mode suggestions : RULES" in off
+    assert "Mode suggestions : IA" in on